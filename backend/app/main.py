@@ -3,20 +3,14 @@ Vocalysis API - Voice-based Mental Health Screening Platform
 CITTAA Health Services Private Limited
 """
 
-from fastapi import FastAPI, HTTPException, Depends, File, UploadFile, Security, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-import os
-import uuid
-from datetime import datetime, timedelta
-import jwt
-from typing import Optional
+from datetime import datetime, timezone
 
 from app.routers import auth, voice, predictions, dashboard, admin, psychologist
-from app.models.database import init_db, get_db
-from app.utils.config import settings
+from app.models.database import init_db
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -30,6 +24,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -67,7 +62,7 @@ async def health_check():
         "status": "healthy",
         "service": "vocalysis-api",
         "version": "1.0.0",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 @app.get("/api/v1/status")
@@ -80,7 +75,7 @@ async def api_status():
             "ml_inference": "active",
             "database": "connected"
         },
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 if __name__ == "__main__":
@@ -38,4 +38,11 @@ def init_db():
     from app.models.clinical_assessment import ClinicalAssessment
     
     Base.metadata.create_all(bind=engine)
+    
+    # create_all skips tables that already exist, indexes included, so
+    # indexes added to a model later are created here for older databases
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    
     print("Database tables created successfully")
@@ -2,7 +2,7 @@
 User model for Vocalysis
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, Enum, Text, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, Enum, Text, Integer, Float, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -20,6 +20,10 @@ class UserRole(str, enum.Enum):
 class User(Base):
     """User model"""
     __tablename__ = "users"
+    __table_args__ = (
+        # Psychologist views filter on (assigned_psychologist_id, role)
+        Index("ix_users_assigned_psychologist_role", "assigned_psychologist_id", "role"),
+    )
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     email = Column(String(255), unique=True, nullable=False, index=True)
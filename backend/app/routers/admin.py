@@ -2,7 +2,7 @@
 Admin router for Vocalysis API
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime, timedelta
@@ -82,6 +82,7 @@ async def get_pending_approvals(
 @router.post("/approve-participant/{user_id}")
 async def approve_clinical_trial_participant(
     user_id: str,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_role(["super_admin"])),
     db: Session = Depends(get_db)
 ):
@@ -100,18 +101,17 @@ async def approve_clinical_trial_participant(
     
     db.commit()
     
-    # Send approval email
-    try:
-        # Get assigned psychologist name if available
-        psychologist_name = None
-        if user.assigned_psychologist_id:
-            psychologist = db.query(User).filter(User.id == user.assigned_psychologist_id).first()
-            if psychologist:
-                psychologist_name = psychologist.full_name
-        
-        email_service.send_trial_approval_email(user.email, user.full_name, psychologist_name)
-    except Exception as e:
-        print(f"Failed to send approval email: {e}")
+    # Get assigned psychologist name if available
+    psychologist_name = None
+    if user.assigned_psychologist_id:
+        psychologist = db.query(User).filter(User.id == user.assigned_psychologist_id).first()
+        if psychologist:
+            psychologist_name = psychologist.full_name
+    
+    # Send approval email after the response; email_service logs its own failures
+    background_tasks.add_task(
+        email_service.send_trial_approval_email, user.email, user.full_name, psychologist_name
+    )
     
     return {"message": f"User {user.email} approved for clinical trial"}
 
@@ -242,7 +242,7 @@ async def get_organization_metrics(
     """Get aggregated metrics for an organization (HR view)"""
     # Get organization users
     org_users = db.query(User).filter(User.organization_id == org_id).all()
-    user_ids = [u.id for u in org_users]
+    user_ids = {u.id for u in org_users}
     
     if not user_ids:
         return {
@@ -270,7 +270,7 @@ async def get_organization_metrics(
         VoiceSample.user_id.in_(user_ids)
     ).count()
     
-    active_users = len(set(p.user_id for p in predictions))
+    active_users = len({p.user_id for p in predictions})
     
     return {
         "organization_id": org_id,
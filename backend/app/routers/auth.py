@@ -2,8 +2,9 @@
 Authentication router for Vocalysis API
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 import jwt
@@ -21,7 +22,7 @@ security = HTTPBearer()
 
 def hash_password(password: str) -> str:
     """Hash password using bcrypt"""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)).decode('utf-8')
 
 def verify_password(password: str, hashed: str) -> bool:
     """Verify password against hash"""
@@ -73,7 +74,11 @@ def require_role(allowed_roles: list):
     return role_checker
 
 @router.post("/register", response_model=Token)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(
+    user_data: UserCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """Register a new user"""
     # Check if email already exists
     existing_user = db.query(User).filter(User.email == user_data.email).first()
@@ -86,7 +91,7 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     # Create new user
     user = User(
         email=user_data.email,
-        password_hash=hash_password(user_data.password),
+        password_hash=await run_in_threadpool(hash_password, user_data.password),
         full_name=user_data.full_name,
         phone=user_data.phone,
         age_range=user_data.age_range,
@@ -101,12 +106,9 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     db.commit()
     db.refresh(user)
     
-    # Send welcome email
-    try:
-        email_service.send_welcome_email(user.email, user.full_name)
-    except Exception as e:
-        # Log but don't fail registration if email fails
-        print(f"Failed to send welcome email: {e}")
+    # Send welcome email after the response so SMTP latency stays off the
+    # request path (send failures are logged by the email service)
+    background_tasks.add_task(email_service.send_welcome_email, user.email, user.full_name)
     
     # Create token
     token = create_token(user.id, user.role)
@@ -121,7 +123,8 @@ async def login(credentials: UserLogin, db: Session = Depends(get_db)):
     """Login user"""
     user = db.query(User).filter(User.email == credentials.email).first()
     
-    if not user or not verify_password(credentials.password, user.password_hash):
+    # bcrypt is deliberately slow; keep it off the event loop
+    if not user or not await run_in_threadpool(verify_password, credentials.password, user.password_hash):
         raise HTTPException(
             status_code=401,
             detail="Invalid email or password"
@@ -157,16 +160,8 @@ async def update_profile(
     db: Session = Depends(get_db)
 ):
     """Update current user profile"""
-    if update_data.full_name is not None:
-        current_user.full_name = update_data.full_name
-    if update_data.phone is not None:
-        current_user.phone = update_data.phone
-    if update_data.age_range is not None:
-        current_user.age_range = update_data.age_range
-    if update_data.gender is not None:
-        current_user.gender = update_data.gender
-    if update_data.language_preference is not None:
-        current_user.language_preference = update_data.language_preference
+    for field, value in update_data.model_dump(exclude_none=True).items():
+        setattr(current_user, field, value)
     
     db.commit()
     db.refresh(current_user)
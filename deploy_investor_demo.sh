@@ -10,6 +10,7 @@ docker run -d \
   -v $(pwd)/model:/app/model \
   -e DB_TYPE=sqlite \
   -e ENCRYPTION_KEY=vocalysis_secure_encryption_key_for_investor_demo \
+  -e VOCALYSIS_STORAGE_SECRET=vocalysis_secure_storage_secret_for_investor_demo \
   vocalysis-investor-demo
 
 echo "Vocalysis container started on port 8501"
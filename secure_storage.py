@@ -3,82 +3,667 @@ import json
 import base64
 import sqlite3
 import psycopg2
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
+from psycopg2.extras import execute_batch
+from psycopg2.pool import ThreadedConnectionPool, PoolError
+import struct
+import threading
+import time
+import warnings
+import functools
+import hashlib
+import msgpack
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes, hmac, padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from datetime import datetime
 import uuid
+import zstandard as zstd
+
+try:
+    from rfernet import Fernet as RFernet
+except ImportError:
+    RFernet = None
+
+# Use the Rust Fernet implementation when available; set to False to
+# benchmark against the cryptography implementation
+USE_RFERNET = RFernet is not None
+
+# Fernet token layout: version | timestamp | IV | ciphertext | HMAC
+_FERNET_VERSION = b'\x80'
+
+# Plaintext framing inside the Fernet token; rows written before
+# compression carry no header and are returned as-is
+_PAYLOAD_RAW = b'VZS\x00'
+_PAYLOAD_ZSTD = b'VZS\x01'
+_ZSTD_LEVEL = 3
+
+# Batches at least this large are decrypted across a thread pool; OpenSSL
+# releases the GIL inside AES and HMAC
+_PARALLEL_DECRYPT_MIN = 64
+
+# PBKDF2-HMAC-SHA256 work factor (OWASP 2023 guidance)
+_KDF_ITERATIONS = 600000
+# Passphrase the storage key is derived from when no encryption_key is given
+_SECRET_ENV = 'VOCALYSIS_STORAGE_SECRET'
+_SALT_PATH = 'data/.salt'
+_SALT_BYTES = 16
+
+_SQLITE_PATH = 'data/vocalysis.db'
+
+# PostgreSQL pool: threads past max_connections wait up to _POOL_TIMEOUT
+# seconds for a connection to be returned before giving up
+_POOL_MAX_CONNECTIONS = 16
+_POOL_TIMEOUT = 30
+
+# Bump when _create_tables changes; stored in SQLite's PRAGMA user_version.
+# Version 1 was also stamped onto unmigrated TEXT-id databases, so 2 makes
+# every existing file go through the column check once more
+_SCHEMA_VERSION = 2
+
+# Columns of the original TEXT-id tables, copied by _migrate_legacy_tables
+_LEGACY_COLUMNS = {
+    'voice_data': ('id', 'data', 'metadata', 'created_at'),
+    'model_artifacts': ('id', 'model_type', 'data', 'metadata', 'created_at'),
+    'analysis_results': ('id', 'voice_data_id', 'results', 'created_at'),
+}
+
+# Databases (SQLite paths or PostgreSQL DSNs) whose schema this process
+# has already created or verified
+_INITIALIZED = set()
+
+# Hot-path statements, built once so SQLite's statement cache and the
+# PostgreSQL translation cache always see the same string
+_SQL_INSERT_VOICE = 'INSERT INTO voice_data (id, data, metadata, created_at) VALUES (?, ?, ?, ?)'
+_SQL_GET_VOICE = 'SELECT data, metadata FROM voice_data WHERE id = ?'
+_SQL_GET_VOICE_BATCH = 'SELECT id, data, metadata FROM voice_data WHERE id IN ({placeholders})'
+_SQL_INSERT_MODEL = 'INSERT INTO model_artifacts (id, model_type, data, metadata, created_at) VALUES (?, ?, ?, ?, ?)'
+_SQL_GET_MODEL = 'SELECT data, model_type, metadata FROM model_artifacts WHERE id = ?'
+_SQL_INSERT_RESULTS = 'INSERT INTO analysis_results (id, voice_data_id, results, created_at) VALUES (?, ?, ?, ?)'
+_SQL_GET_RESULTS = 'SELECT results, voice_data_id FROM analysis_results WHERE id = ?'
+
+# OPENSSL_ia32cap bit that advertises AES-NI to OpenSSL
+_IA32CAP_AESNI_BIT = 1 << 57
+
+
+@functools.lru_cache(maxsize=None)
+def _check_aes_acceleration():
+    """Warn once per process if AES hardware acceleration looks unavailable
+    
+    Fernet is AES-128-CBC; without AES-NI (or the ARMv8 AES extension)
+    OpenSSL falls back to a much slower software implementation. Set
+    VOCALYSIS_FORCE_AESNI=1 to fail instead of warning.
+    
+    Returns:
+        bool: True if acceleration is (or cannot be shown not to be) active
+    """
+    reasons = []
+    
+    try:
+        with open('/proc/cpuinfo') as f:
+            cpu_flags = set()
+            for line in f:
+                if line.startswith(('flags', 'Features')):
+                    cpu_flags.update(line.split(':', 1)[1].split())
+        if cpu_flags and 'aes' not in cpu_flags:
+            reasons.append("CPU does not report the 'aes' flag")
+    except OSError:
+        pass  # Not Linux; nothing reliable to check
+    
+    ia32cap = os.environ.get('OPENSSL_ia32cap')
+    if ia32cap:
+        first_word = ia32cap.split(':', 1)[0]
+        try:
+            if first_word.startswith('~'):
+                aesni_masked = int(first_word[1:], 0) & _IA32CAP_AESNI_BIT
+            else:
+                aesni_masked = not int(first_word, 0) & _IA32CAP_AESNI_BIT
+        except ValueError:
+            aesni_masked = False
+        if aesni_masked:
+            reasons.append("OPENSSL_ia32cap disables AES-NI")
+    
+    if not reasons:
+        return True
+    
+    try:
+        from cryptography.hazmat.backends.openssl.backend import backend
+        openssl_version = backend.openssl_version_text()
+    except Exception:
+        openssl_version = 'unknown OpenSSL'
+    
+    message = (
+        f"AES hardware acceleration not active ({'; '.join(reasons)}; {openssl_version}). "
+        "Fernet encryption will fall back to much slower software AES."
+    )
+    if os.environ.get('VOCALYSIS_FORCE_AESNI') == '1':
+        raise RuntimeError(message)
+    warnings.warn(message, RuntimeWarning)
+    return False
+
+
+def _now_us():
+    """Current time as integer microseconds since the epoch"""
+    return time.time_ns() // 1000
+
+
+@functools.lru_cache(maxsize=32)
+def _get_cipher(key, use_rfernet=False):
+    """Build a Fernet cipher, once per key
+    
+    Args:
+        key (bytes or str): URL-safe base64 encoded 32-byte key
+        use_rfernet (bool): Build the Rust implementation instead
+        
+    Returns:
+        Fernet cipher for key
+    """
+    if use_rfernet:
+        return RFernet(key.decode() if isinstance(key, bytes) else key)
+    return Fernet(key)
+
+
+@functools.lru_cache(maxsize=16)
+def _derive_key(password, salt):
+    """Derive a Fernet key from a password, once per process
+    
+    Args:
+        password (bytes): Password to derive from
+        salt (bytes): KDF salt
+        
+    Returns:
+        bytes: URL-safe base64 encoded 32-byte key
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=_KDF_ITERATIONS,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(password))
+
+
+@functools.lru_cache(maxsize=64)
+def _postgres_sql(query):
+    """Translate a SQLite-flavoured query for PostgreSQL, once per query
+    
+    Args:
+        query (str): Query using ? placeholders and BLOB columns
+        
+    Returns:
+        str: Query using %s placeholders and BYTEA columns
+    """
+    return query.replace('?', '%s').replace('BLOB', 'BYTEA')
+
+
+def _id_to_bytes(record_id):
+    """Convert a record ID to its stored 16-byte form
+    
+    Args:
+        record_id (str or bytes): Hex (with or without dashes) or raw UUID
+        
+    Returns:
+        bytes or str: Raw UUID bytes, or the input unchanged if it is not a UUID
+    """
+    if isinstance(record_id, (bytes, bytearray, memoryview)):
+        return bytes(record_id)
+    try:
+        return uuid.UUID(record_id).bytes
+    except (TypeError, ValueError):
+        return record_id
+
+
+def _id_to_str(record_id):
+    """Convert a stored record ID back to the string form callers use
+    
+    Args:
+        record_id (bytes or str): ID as read from the database
+        
+    Returns:
+        str: Dashed UUID string, as returned by str(uuid.uuid4())
+    """
+    if isinstance(record_id, (bytes, bytearray, memoryview)):
+        return str(uuid.UUID(bytes=bytes(record_id)))
+    return record_id
+
+
+def _timestamp_to_us(value):
+    """Convert a legacy TIMESTAMP column value to epoch microseconds
+    
+    Args:
+        value (str, int or None): ISO timestamp as written by sqlite3's
+            default datetime adapter, or an already converted integer
+            
+    Returns:
+        int or None: Microseconds since the epoch
+    """
+    if value is None or isinstance(value, int):
+        return value
+    dt = datetime.fromisoformat(value)
+    return int(dt.timestamp()) * 1000000 + dt.microsecond
+
+
+def _pack(obj):
+    """Serialize metadata or results for storage
+    
+    Args:
+        obj: JSON-compatible value
+        
+    Returns:
+        bytes: msgpack encoding of obj
+    """
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def _unpack(raw):
+    """Deserialize a metadata or results column
+    
+    Rows written before the switch to msgpack hold JSON text.
+    
+    Args:
+        raw (bytes or str): Column value
+        
+    Returns:
+        Deserialized value
+    """
+    if isinstance(raw, str):
+        return json.loads(raw)
+    raw = bytes(raw)
+    if raw[:1] in (b'{', b'['):
+        return json.loads(raw)
+    # JSON-era callers may store int keys (e.g. per-segment scores)
+    return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+
+
+def _load_salt(path=_SALT_PATH):
+    """Load the persistent KDF salt, creating it on first use
+    
+    The file is created exclusively with owner-only permissions, so two
+    processes starting together agree on one salt.
+    
+    Args:
+        path (str): Location of the salt file
+        
+    Returns:
+        bytes: 16-byte salt
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    except FileExistsError:
+        pass
+    else:
+        salt = os.urandom(_SALT_BYTES)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(salt)
+            f.flush()
+            os.fsync(f.fileno())
+        return salt
+    
+    # Another process may have created the file but not written it yet
+    for _ in range(50):
+        with open(path, 'rb') as f:
+            salt = f.read()
+        if salt:
+            break
+        time.sleep(0.02)
+    
+    if len(salt) != _SALT_BYTES:
+        raise ValueError(f"KDF salt file {path} is {len(salt)} bytes, expected {_SALT_BYTES}")
+    return salt
+
 
 class SecureStorage:
     """Secure storage for voice data and model artifacts"""
     
-    def __init__(self, storage_type='sqlite', connection_string=None, encryption_key=None):
+    # PostgreSQL connection pools shared by all instances, keyed by DSN
+    _pools = {}
+    
+    def __init__(self, storage_type='sqlite', connection_string=None, encryption_key=None,
+                 decrypt_cache_bytes=64 * 1024 * 1024, cache_voice_data=False,
+                 max_connections=None):
         """Initialize the secure storage
         
         Args:
             storage_type (str): Type of storage ('sqlite' or 'postgresql')
             connection_string (str, optional): Connection string for PostgreSQL
-            encryption_key (str, optional): Encryption key for data
+            encryption_key (str, optional): Encryption key for data; if omitted,
+                the key is derived from the VOCALYSIS_STORAGE_SECRET
+                environment variable
+            decrypt_cache_bytes (int): Total size of decrypted payloads to keep
+                in memory for repeated reads (0 disables the cache)
+            cache_voice_data (bool): Also cache decrypted voice recordings;
+                off by default so patient audio is not kept in plaintext
+                beyond the call that asked for it
+            max_connections (int, optional): Size of the PostgreSQL connection
+                pool shared by every instance using the same DSN; defaults to
+                VOCALYSIS_PG_MAX_CONNECTIONS or 16. Only the first instance
+                for a DSN sizes the pool. Threads beyond the limit wait for
+                a free connection rather than failing
         """
         self.storage_type = storage_type
         self.connection_string = connection_string
+        self.decrypt_cache_bytes = decrypt_cache_bytes
+        self.cache_voice_data = cache_voice_data
+        if max_connections is None:
+            max_connections = int(os.environ.get('VOCALYSIS_PG_MAX_CONNECTIONS', _POOL_MAX_CONNECTIONS))
+        self.max_connections = max_connections
+        self._decrypt_cache = OrderedDict()
+        self._decrypt_cache_used = 0
+        self._decrypt_cache_lock = threading.Lock()
+        # Per-thread SQLite connection and cursor (so one thread's commit or
+        # rollback never ends another thread's transaction) and zstd contexts
+        self._local = threading.local()
+        self._sqlite_conns = []
+        self._sqlite_conns_lock = threading.Lock()
+        
+        _check_aes_acceleration()
         
         if encryption_key is None:
-            salt = os.urandom(16)
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
-            )
-            self.key = base64.urlsafe_b64encode(kdf.derive(b"vocalysis-secure-storage"))
+            secret = os.environ.get(_SECRET_ENV)
+            if not secret:
+                raise ValueError(f"SecureStorage needs an encryption_key or the {_SECRET_ENV} environment variable")
+            self.key = _derive_key(secret.encode(), _load_salt())
         else:
             self.key = encryption_key
         
-        self.cipher = Fernet(self.key)
+        # rfernet takes and returns str tokens, cryptography uses bytes
+        self._use_rfernet = USE_RFERNET and RFernet is not None
+        self.cipher = _get_cipher(self.key, self._use_rfernet)
+        
+        # Split the Fernet key once so batch paths can drive AES/HMAC directly
+        raw_key = base64.urlsafe_b64decode(self.key)
+        self._signing_key, self._encryption_key = raw_key[:16], raw_key[16:]
         
         self._init_db()
     
     def _init_db(self):
-        """Initialize the database"""
+        """Initialize the database
+        
+        Schema DDL runs once per database per process; for SQLite,
+        PRAGMA user_version also records it across processes.
+        """
         if self.storage_type == 'sqlite':
-            os.makedirs('data', exist_ok=True)
-            self.conn = sqlite3.connect('data/vocalysis.db')
+            db_key = _SQLITE_PATH
+            os.makedirs(os.path.dirname(_SQLITE_PATH), exist_ok=True)
+            if not os.path.exists(_SQLITE_PATH):
+                _INITIALIZED.discard(db_key)
+            self.conn = self._local.conn = self._sqlite_connect()
         else:
-            self.conn = psycopg2.connect(self.connection_string)
+            db_key = self.connection_string
+            if self.connection_string not in SecureStorage._pools:
+                SecureStorage._pools[self.connection_string] = ThreadedConnectionPool(
+                    minconn=1, maxconn=self.max_connections, dsn=self.connection_string
+                )
+            self.pool = SecureStorage._pools[self.connection_string]
+            self.conn = None
+        
+        if db_key in _INITIALIZED:
+            return
         
-        cursor = self.conn.cursor()
+        if self.storage_type == 'sqlite':
+            if self.conn.execute('PRAGMA user_version').fetchone()[0] >= _SCHEMA_VERSION:
+                _INITIALIZED.add(db_key)
+                return
+            # journal_mode is persistent, so it only needs setting once per file
+            self.conn.execute('PRAGMA journal_mode=WAL')
+        
+        with self._cursor(commit=True) as cursor:
+            if self.storage_type == 'sqlite':
+                legacy_tables = self._legacy_tables(cursor)
+                if legacy_tables:
+                    self._migrate_legacy_tables(cursor, legacy_tables)
+            self._create_tables(cursor)
+            
+            if self.storage_type == 'sqlite':
+                # CREATE TABLE IF NOT EXISTS leaves old tables alone, so only
+                # record the version once the columns really have it
+                if self._legacy_tables(cursor):
+                    raise RuntimeError('SecureStorage tables still use the legacy TEXT-id schema')
+                cursor.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+        
+        _INITIALIZED.add(db_key)
+    
+    def _sqlite_connect(self):
+        """Open a SQLite connection for the calling thread
+        
+        Returns:
+            sqlite3.Connection: Connection with the storage pragmas applied
+        """
+        # check_same_thread is off only so close() can close every
+        # thread's connection
+        conn = sqlite3.connect(
+            _SQLITE_PATH, timeout=30, check_same_thread=False, cached_statements=256
+        )
+        # NORMAL sync under WAL avoids an fsync pair on every small commit
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        conn.execute('PRAGMA cache_size=-65536')
         
-        cursor.execute('''
+        with self._sqlite_conns_lock:
+            self._sqlite_conns.append(conn)
+        return conn
+    
+    def _create_tables(self, cursor):
+        """Create the storage tables if they do not exist"""
+        cursor.execute(self._sql('''
         CREATE TABLE IF NOT EXISTS voice_data (
-            id TEXT PRIMARY KEY,
+            id BLOB PRIMARY KEY,
             data BLOB,
-            metadata TEXT,
-            created_at TIMESTAMP
+            metadata BLOB,
+            created_at BIGINT
         )
-        ''')
+        '''))
         
-        cursor.execute('''
+        cursor.execute(self._sql('''
         CREATE TABLE IF NOT EXISTS model_artifacts (
-            id TEXT PRIMARY KEY,
+            id BLOB PRIMARY KEY,
             model_type TEXT,
             data BLOB,
-            metadata TEXT,
-            created_at TIMESTAMP
+            metadata BLOB,
+            created_at BIGINT
         )
-        ''')
+        '''))
         
-        cursor.execute('''
+        cursor.execute(self._sql('''
         CREATE TABLE IF NOT EXISTS analysis_results (
-            id TEXT PRIMARY KEY,
-            voice_data_id TEXT,
-            results TEXT,
-            created_at TIMESTAMP,
+            id BLOB PRIMARY KEY,
+            voice_data_id BLOB,
+            results BLOB,
+            created_at BIGINT,
             FOREIGN KEY (voice_data_id) REFERENCES voice_data (id)
         )
-        ''')
+        '''))
+        
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_voice_created ON voice_data (created_at)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_results_voice ON analysis_results (voice_data_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_model_type ON model_artifacts (model_type)')
+    
+    def _legacy_tables(self, cursor):
+        """Find tables still in the original TEXT-id schema
+        
+        Args:
+            cursor: Cursor from _cursor()
+            
+        Returns:
+            list: Names of tables whose id column is declared TEXT
+        """
+        legacy_tables = []
+        for table in _LEGACY_COLUMNS:
+            cursor.execute(f'PRAGMA table_info({table})')
+            column_types = {row[1]: row[2].upper() for row in cursor.fetchall()}
+            if column_types.get('id') == 'TEXT':
+                legacy_tables.append(table)
+        return legacy_tables
+    
+    def _migrate_legacy_tables(self, cursor, tables):
+        """Convert SQLite tables written by the original schema
+        
+        SQLite cannot change a column's type, so each table is renamed,
+        recreated and copied in one transaction. IDs become 16-byte UUIDs
+        and TIMESTAMP strings become epoch microseconds; ciphertexts and
+        JSON metadata are copied unchanged since _decrypt and _unpack
+        still read them. The original schema never worked on PostgreSQL
+        (it declared BLOB columns), so there is nothing to migrate there.
+        
+        Args:
+            cursor: Cursor from _cursor()
+            tables (list): Table names from _legacy_tables()
+        """
+        cursor.execute('BEGIN')
+        # Keep FOREIGN KEY clauses pointing at the final table names
+        cursor.execute('PRAGMA legacy_alter_table=ON')
+        for table in tables:
+            cursor.execute(f'ALTER TABLE {table} RENAME TO {table}_legacy')
+        cursor.execute('PRAGMA legacy_alter_table=OFF')
+        
+        self._create_tables(cursor)
+        
+        for table in tables:
+            columns = _LEGACY_COLUMNS[table]
+            cursor.execute(f"SELECT {', '.join(columns)} FROM {table}_legacy")
+            rows = [
+                tuple(
+                    _id_to_bytes(value) if column in ('id', 'voice_data_id')
+                    else _timestamp_to_us(value) if column == 'created_at'
+                    else value
+                    for column, value in zip(columns, row)
+                )
+                for row in cursor.fetchall()
+            ]
+            cursor.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                rows
+            )
+            cursor.execute(f'DROP TABLE {table}_legacy')
+    
+    def _sql(self, query):
+        """Adapt a SQLite-flavoured query to the configured backend
+        
+        Args:
+            query (str): Query using ? placeholders and BLOB columns
+            
+        Returns:
+            str: Query for the active storage backend
+        """
+        if self.storage_type == 'sqlite':
+            return query
+        return _postgres_sql(query)
+    
+    def _executemany(self, cursor, query, rows):
+        """Run a statement over many rows
+        
+        psycopg2's executemany issues one round trip per row; execute_batch
+        packs them into a few multi-statement pages instead.
+        
+        Args:
+            cursor: Cursor from _cursor()
+            query (str): SQLite-flavoured statement
+            rows (list): Parameter tuples
+        """
+        if self.storage_type == 'sqlite':
+            cursor.executemany(query, rows)
+        else:
+            execute_batch(cursor, _postgres_sql(query), rows, page_size=100)
+    
+    def _getconn(self):
+        """Check a connection out of the PostgreSQL pool, waiting if needed
+        
+        psycopg2's pool raises PoolError as soon as every connection is in
+        use, so retry with a short backoff until one is returned.
+        
+        Returns:
+            psycopg2 connection
+        """
+        deadline = time.monotonic() + _POOL_TIMEOUT
+        delay = 0.005
+        while True:
+            try:
+                return self.pool.getconn()
+            except PoolError:
+                if self.pool.closed or time.monotonic() >= deadline:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, 0.1)
+    
+    @contextmanager
+    def _cursor(self, commit=False):
+        """Yield a cursor, checking a pooled connection out for PostgreSQL
+        
+        SQLite reuses one connection and cursor per thread; pooled
+        PostgreSQL connections get a fresh cursor per checkout.
+        
+        Args:
+            commit (bool): Commit the transaction if the block succeeds
+        """
+        if self.storage_type == 'sqlite':
+            conn = getattr(self._local, 'conn', None)
+            if conn is None:
+                conn = self._local.conn = self._sqlite_connect()
+            cursor = getattr(self._local, 'cursor', None)
+            if cursor is None:
+                cursor = self._local.cursor = conn.cursor()
+        else:
+            conn = self._getconn()
+            cursor = conn.cursor()
+        try:
+            yield cursor
+            if commit:
+                conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            if self.storage_type != 'sqlite':
+                self.pool.putconn(conn)
+    
+    def _zstd_contexts(self):
+        """Return the calling thread's zstd compressor and decompressor
+        
+        zstd contexts are not safe to share across threads, so each thread
+        builds its own pair once and reuses it.
+        
+        Returns:
+            tuple: (ZstdCompressor, ZstdDecompressor)
+        """
+        contexts = getattr(self._local, 'zstd', None)
+        if contexts is None:
+            contexts = self._local.zstd = (zstd.ZstdCompressor(level=_ZSTD_LEVEL), zstd.ZstdDecompressor())
+        return contexts
+    
+    def _compress(self, data):
+        """Compress a payload ahead of encryption
+        
+        Args:
+            data (bytes): Plaintext payload
+            
+        Returns:
+            bytes: Framed payload, zstd-compressed unless that does not help
+        """
+        compressed = self._zstd_contexts()[0].compress(data)
+        if len(compressed) < len(data):
+            return _PAYLOAD_ZSTD + compressed
+        return _PAYLOAD_RAW + data
+    
+    def _decompress(self, data):
+        """Undo _compress on a decrypted payload
         
-        self.conn.commit()
+        Args:
+            data (bytes): Decrypted payload
+            
+        Returns:
+            bytes: Original plaintext
+        """
+        header = data[:4]
+        if header == _PAYLOAD_ZSTD:
+            return self._zstd_contexts()[1].decompress(data[4:])
+        if header == _PAYLOAD_RAW:
+            return data[4:]
+        return data
     
     def _encrypt(self, data):
         """Encrypt data
@@ -89,18 +674,143 @@ class SecureStorage:
         Returns:
             bytes: Encrypted data
         """
+        data = self._compress(data)
+        if self._use_rfernet:
+            return self.cipher.encrypt(data).encode('ascii')
         return self.cipher.encrypt(data)
     
-    def _decrypt(self, encrypted_data):
+    def _decrypt(self, encrypted_data, cache=True):
         """Decrypt data
         
         Args:
             encrypted_data (bytes): Encrypted data
+            cache (bool): Look the payload up in, and add it to, the
+                decrypt cache
             
         Returns:
             bytes: Decrypted data
         """
-        return self.cipher.decrypt(encrypted_data)
+        # psycopg2 returns BYTEA columns as memoryview
+        encrypted_data = bytes(encrypted_data)
+        
+        cache = cache and self.decrypt_cache_bytes > 0
+        if cache:
+            # Key on a digest so large ciphertexts are not held as cache keys
+            cache_key = hashlib.blake2b(encrypted_data, digest_size=16).digest()
+            with self._decrypt_cache_lock:
+                cached = self._decrypt_cache.get(cache_key)
+                if cached is not None:
+                    self._decrypt_cache.move_to_end(cache_key)
+                    return cached
+        
+        if self._use_rfernet:
+            decrypted = self.cipher.decrypt(encrypted_data.decode('ascii'))
+        else:
+            decrypted = self.cipher.decrypt(encrypted_data)
+        decrypted = self._decompress(decrypted)
+        
+        if cache and len(decrypted) <= self.decrypt_cache_bytes:
+            with self._decrypt_cache_lock:
+                previous = self._decrypt_cache.pop(cache_key, None)
+                if previous is not None:
+                    self._decrypt_cache_used -= len(previous)
+                self._decrypt_cache[cache_key] = decrypted
+                self._decrypt_cache_used += len(decrypted)
+                while self._decrypt_cache_used > self.decrypt_cache_bytes:
+                    _, evicted = self._decrypt_cache.popitem(last=False)
+                    self._decrypt_cache_used -= len(evicted)
+        
+        return decrypted
+    
+    def _encrypt_many(self, payloads):
+        """Encrypt several payloads into Fernet tokens
+        
+        Reuses the derived AES/HMAC keys and a single HMAC context for the
+        whole batch instead of going through Fernet once per payload.
+        
+        Args:
+            payloads (list): List of bytes to encrypt
+            
+        Returns:
+            list: Encrypted tokens, compatible with _decrypt
+        """
+        aes = algorithms.AES(self._encryption_key)
+        base_mac = hmac.HMAC(self._signing_key, hashes.SHA256())
+        header_prefix = _FERNET_VERSION + struct.pack('>Q', int(time.time()))
+        
+        tokens = []
+        for data in payloads:
+            data = self._compress(data)
+            iv = os.urandom(16)
+            padder = padding.PKCS7(algorithms.AES.block_size).padder()
+            padded = padder.update(data) + padder.finalize()
+            encryptor = Cipher(aes, modes.CBC(iv)).encryptor()
+            basic_parts = header_prefix + iv + encryptor.update(padded) + encryptor.finalize()
+            
+            mac = base_mac.copy()
+            mac.update(basic_parts)
+            tokens.append(base64.urlsafe_b64encode(basic_parts + mac.finalize()))
+        
+        return tokens
+    
+    def _decrypt_chunk(self, tokens):
+        """Verify and decrypt Fernet tokens without decompressing them
+        
+        Builds its own HMAC context so chunks can run on separate threads.
+        
+        Args:
+            tokens (list): List of encrypted tokens
+            
+        Returns:
+            list: Framed plaintext payloads
+        """
+        aes = algorithms.AES(self._encryption_key)
+        base_mac = hmac.HMAC(self._signing_key, hashes.SHA256())
+        
+        decrypted = []
+        for token in tokens:
+            data = base64.urlsafe_b64decode(bytes(token))
+            if len(data) < 57 or data[:1] != _FERNET_VERSION:
+                raise InvalidToken
+            
+            mac = base_mac.copy()
+            mac.update(data[:-32])
+            try:
+                mac.verify(data[-32:])
+            except Exception:
+                raise InvalidToken
+            
+            decryptor = Cipher(aes, modes.CBC(data[9:25])).decryptor()
+            padded = decryptor.update(data[25:-32]) + decryptor.finalize()
+            unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+            decrypted.append(unpadder.update(padded) + unpadder.finalize())
+        
+        return decrypted
+    
+    def _decrypt_many(self, tokens):
+        """Decrypt several Fernet tokens
+        
+        Large batches are split across a thread pool.
+        
+        Args:
+            tokens (list): List of encrypted tokens
+            
+        Returns:
+            list: Decrypted data, in the same order as tokens
+        """
+        tokens = list(tokens)
+        workers = min(os.cpu_count() or 1, len(tokens) // _PARALLEL_DECRYPT_MIN)
+        
+        if workers > 1:
+            size = -(-len(tokens) // workers)
+            chunks = [tokens[i:i + size] for i in range(0, len(tokens), size)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                framed = [data for chunk in executor.map(self._decrypt_chunk, chunks) for data in chunk]
+        else:
+            framed = self._decrypt_chunk(tokens)
+        
+        # Decompress on this thread, with its own zstd context
+        return [self._decompress(data) for data in framed]
     
     def store_voice_data(self, audio_data, metadata=None):
         """Store voice data securely
@@ -112,22 +822,21 @@ class SecureStorage:
         Returns:
             str: ID of the stored data
         """
-        data_id = str(uuid.uuid4())
+        data_id = uuid.uuid4()
         encrypted_data = self._encrypt(audio_data)
         
-        cursor = self.conn.cursor()
-        cursor.execute(
-            'INSERT INTO voice_data (id, data, metadata, created_at) VALUES (?, ?, ?, ?)',
-            (
-                data_id,
-                encrypted_data,
-                json.dumps(metadata or {}),
-                datetime.now()
+        with self._cursor(commit=True) as cursor:
+            cursor.execute(
+                self._sql(_SQL_INSERT_VOICE),
+                (
+                    data_id.bytes,
+                    encrypted_data,
+                    _pack(metadata or {}),
+                    _now_us()
+                )
             )
-        )
-        self.conn.commit()
         
-        return data_id
+        return str(data_id)
     
     def get_voice_data(self, data_id):
         """Retrieve voice data
@@ -138,19 +847,72 @@ class SecureStorage:
         Returns:
             tuple: (audio_data, metadata)
         """
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT data, metadata FROM voice_data WHERE id = ?', (data_id,))
-        result = cursor.fetchone()
+        with self._cursor() as cursor:
+            cursor.execute(self._sql(_SQL_GET_VOICE), (_id_to_bytes(data_id),))
+            result = cursor.fetchone()
         
         if result is None:
             return None, None
         
-        encrypted_data, metadata_json = result
-        decrypted_data = self._decrypt(encrypted_data)
-        metadata = json.loads(metadata_json)
+        encrypted_data, packed_metadata = result
+        decrypted_data = self._decrypt(encrypted_data, cache=self.cache_voice_data)
+        metadata = _unpack(packed_metadata)
         
         return decrypted_data, metadata
     
+    def store_voice_data_batch(self, items):
+        """Store several voice recordings in a single transaction
+        
+        Args:
+            items (list): List of (audio_data, metadata) tuples
+            
+        Returns:
+            list: IDs of the stored data, in input order
+        """
+        items = list(items)
+        encrypted = self._encrypt_many([audio_data for audio_data, _ in items])
+        now = _now_us()
+        
+        rows = [
+            (uuid.uuid4().bytes, encrypted_data, _pack(metadata or {}), now)
+            for encrypted_data, (_, metadata) in zip(encrypted, items)
+        ]
+        
+        with self._cursor(commit=True) as cursor:
+            self._executemany(cursor, _SQL_INSERT_VOICE, rows)
+        
+        return [_id_to_str(row[0]) for row in rows]
+    
+    def get_voice_data_batch(self, data_ids):
+        """Retrieve several voice recordings
+        
+        Args:
+            data_ids (list): IDs of the data to retrieve
+            
+        Returns:
+            list: (audio_data, metadata) tuples in input order; (None, None)
+                for IDs that are not found
+        """
+        keys = [_id_to_bytes(data_id) for data_id in data_ids]
+        if not keys:
+            return []
+        
+        placeholders = ', '.join('?' for _ in keys)
+        with self._cursor() as cursor:
+            cursor.execute(
+                self._sql(_SQL_GET_VOICE_BATCH.format(placeholders=placeholders)),
+                keys
+            )
+            rows = {_id_to_bytes(row[0]): row[1:] for row in cursor.fetchall()}
+        
+        found = [key for key in keys if key in rows]
+        decrypted = dict(zip(found, self._decrypt_many([rows[key][0] for key in found])))
+        
+        return [
+            (decrypted[key], _unpack(rows[key][1])) if key in rows else (None, None)
+            for key in keys
+        ]
+    
     def store_model(self, model_data, model_type, metadata=None):
         """Store model artifact securely
         
@@ -162,23 +924,45 @@ class SecureStorage:
         Returns:
             str: ID of the stored model
         """
-        model_id = str(uuid.uuid4())
+        model_id = uuid.uuid4()
         encrypted_data = self._encrypt(model_data)
         
-        cursor = self.conn.cursor()
-        cursor.execute(
-            'INSERT INTO model_artifacts (id, model_type, data, metadata, created_at) VALUES (?, ?, ?, ?, ?)',
-            (
-                model_id,
-                model_type,
-                encrypted_data,
-                json.dumps(metadata or {}),
-                datetime.now()
+        with self._cursor(commit=True) as cursor:
+            cursor.execute(
+                self._sql(_SQL_INSERT_MODEL),
+                (
+                    model_id.bytes,
+                    model_type,
+                    encrypted_data,
+                    _pack(metadata or {}),
+                    _now_us()
+                )
             )
-        )
-        self.conn.commit()
         
-        return model_id
+        return str(model_id)
+    
+    def store_model_batch(self, items):
+        """Store several model artifacts in a single transaction
+        
+        Args:
+            items (list): List of (model_data, model_type, metadata) tuples
+            
+        Returns:
+            list: IDs of the stored models, in input order
+        """
+        items = list(items)
+        encrypted = self._encrypt_many([model_data for model_data, _, _ in items])
+        now = _now_us()
+        
+        rows = [
+            (uuid.uuid4().bytes, model_type, encrypted_data, _pack(metadata or {}), now)
+            for encrypted_data, (_, model_type, metadata) in zip(encrypted, items)
+        ]
+        
+        with self._cursor(commit=True) as cursor:
+            self._executemany(cursor, _SQL_INSERT_MODEL, rows)
+        
+        return [_id_to_str(row[0]) for row in rows]
     
     def get_model(self, model_id):
         """Retrieve model artifact
@@ -189,16 +973,16 @@ class SecureStorage:
         Returns:
             tuple: (model_data, model_type, metadata)
         """
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT data, model_type, metadata FROM model_artifacts WHERE id = ?', (model_id,))
-        result = cursor.fetchone()
+        with self._cursor() as cursor:
+            cursor.execute(self._sql(_SQL_GET_MODEL), (_id_to_bytes(model_id),))
+            result = cursor.fetchone()
         
         if result is None:
             return None, None, None
         
-        encrypted_data, model_type, metadata_json = result
+        encrypted_data, model_type, packed_metadata = result
         decrypted_data = self._decrypt(encrypted_data)
-        metadata = json.loads(metadata_json)
+        metadata = _unpack(packed_metadata)
         
         return decrypted_data, model_type, metadata
     
@@ -212,21 +996,27 @@ class SecureStorage:
         Returns:
             str: ID of the stored results
         """
-        results_id = str(uuid.uuid4())
+        return self.store_analysis_results_batch([(voice_data_id, results)])[0]
+    
+    def store_analysis_results_batch(self, items):
+        """Store several analysis results in a single transaction
         
-        cursor = self.conn.cursor()
-        cursor.execute(
-            'INSERT INTO analysis_results (id, voice_data_id, results, created_at) VALUES (?, ?, ?, ?)',
-            (
-                results_id,
-                voice_data_id,
-                json.dumps(results),
-                datetime.now()
-            )
-        )
-        self.conn.commit()
+        Args:
+            items (list): List of (voice_data_id, results) tuples
+            
+        Returns:
+            list: IDs of the stored results, in input order
+        """
+        now = _now_us()
+        rows = [
+            (uuid.uuid4().bytes, _id_to_bytes(voice_data_id), _pack(results), now)
+            for voice_data_id, results in items
+        ]
         
-        return results_id
+        with self._cursor(commit=True) as cursor:
+            self._executemany(cursor, _SQL_INSERT_RESULTS, rows)
+        
+        return [_id_to_str(row[0]) for row in rows]
     
     def get_analysis_results(self, results_id):
         """Retrieve analysis results
@@ -237,19 +1027,25 @@ class SecureStorage:
         Returns:
             tuple: (results, voice_data_id)
         """
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT results, voice_data_id FROM analysis_results WHERE id = ?', (results_id,))
-        result = cursor.fetchone()
+        with self._cursor() as cursor:
+            cursor.execute(self._sql(_SQL_GET_RESULTS), (_id_to_bytes(results_id),))
+            result = cursor.fetchone()
         
         if result is None:
             return None, None
         
-        results_json, voice_data_id = result
-        results = json.loads(results_json)
+        packed_results, voice_data_id = result
+        results = _unpack(packed_results)
         
-        return results, voice_data_id
+        return results, _id_to_str(voice_data_id)
     
     def close(self):
-        """Close the database connection"""
-        if self.conn:
-            self.conn.close()
+        """Close the database connections
+        
+        Closes every thread's SQLite connection; PostgreSQL connections stay
+        in the shared pool for other instances.
+        """
+        with self._sqlite_conns_lock:
+            conns, self._sqlite_conns = self._sqlite_conns, []
+        for conn in conns:
+            conn.close()
@@ -13,19 +13,23 @@ from secure_storage import SecureStorage
 class TestVocalysis(unittest.TestCase):
     """Test cases for Vocalysis system"""
     
-    def setUp(self):
-        """Set up test environment"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment once for all tests"""
         if not os.path.exists('test_data'):
             os.makedirs('test_data')
         
-        self.test_audio_path = 'test_data/test_audio.wav'
-        if not os.path.exists(self.test_audio_path):
+        os.environ.setdefault('VOCALYSIS_STORAGE_SECRET', 'test-storage-secret')
+        
+        cls.test_audio_path = 'test_data/test_audio.wav'
+        sample_rate = 16000
+        duration = 5  # seconds
+        t = np.arange(sample_rate * duration, dtype=np.float32) * np.float32(1.0 / sample_rate)
+        cls._audio = np.float32(0.5) * np.sin(np.float32(2 * np.pi * 440) * t)  # 440 Hz sine wave
+        
+        if not os.path.exists(cls.test_audio_path):
             import scipy.io.wavfile as wav
-            sample_rate = 16000
-            duration = 5  # seconds
-            t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-            audio = 0.5 * np.sin(2 * np.pi * 440 * t)  # 440 Hz sine wave
-            wav.write(self.test_audio_path, sample_rate, audio.astype(np.float32))
+            wav.write(cls.test_audio_path, sample_rate, cls._audio)
     
     def test_audio_processor(self):
         """Test AudioProcessor class"""
@@ -87,6 +91,32 @@ class TestVocalysis(unittest.TestCase):
         self.assertEqual(ensemble_probs.shape, (batch_size, 4))
         self.assertEqual(ensemble_conf.shape, (batch_size, 1))
     
+    def test_load_model_round_trip(self):
+        """Test load_model -> save_model -> load_model"""
+        import tempfile
+        from vocalysis_clean import save_model, load_model
+
+        feature_names = [f'f{i}' for i in range(50)]
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                save_model(MentalHealthModel(input_dim=50), feature_names)
+                model, model_info = load_model('model/vocalysis_model.pth', 'model/model_info.json')
+                model_info['class_names'].append('Other')
+                _, fresh_info = load_model('model/vocalysis_model.pth', 'model/model_info.json')
+                self.assertEqual(len(fresh_info['class_names']), 4)
+                self.assertIsInstance(model.feature_extractor, torch.nn.Module)
+
+                x = torch.randn(4, 50)
+                expected_probs, _ = model(x)
+                save_model(model, feature_names)
+                reloaded, _ = load_model('model/vocalysis_model.pth', 'model/model_info.json')
+                probs, _ = reloaded(x)
+                self.assertTrue(torch.allclose(probs, expected_probs))
+            finally:
+                os.chdir(cwd)
+    
     def test_secure_storage(self):
         """Test SecureStorage class"""
         storage = SecureStorage(storage_type='sqlite')
@@ -122,7 +152,104 @@ class TestVocalysis(unittest.TestCase):
         storage.close()
         if os.path.exists('data/vocalysis.db'):
             os.remove('data/vocalysis.db')
-    
+
+    def test_secure_storage_batch(self):
+        """Test SecureStorage batch store/get round trip"""
+        storage = SecureStorage(storage_type='sqlite')
+
+        items = [(b'first clip', {'index': 0}), (b'second clip', None)]
+        data_ids = storage.store_voice_data_batch(items)
+
+        self.assertEqual(len(data_ids), 2)
+        self.assertEqual(storage.get_voice_data(data_ids[0]), (b'first clip', {'index': 0}))
+        self.assertEqual(
+            storage.get_voice_data_batch([data_ids[1], 'missing', data_ids[0]]),
+            [(b'second clip', {}), (None, None), (b'first clip', {'index': 0})]
+        )
+
+        model_ids = storage.store_model_batch([(b'weights', 'mlp', {'epochs': 20})])
+        self.assertEqual(storage.get_model(model_ids[0]), (b'weights', 'mlp', {'epochs': 20}))
+
+        results_ids = storage.store_analysis_results_batch(
+            [(data_ids[0], {'score': 1.0}), (data_ids[1], {'score': 2.0})]
+        )
+        self.assertEqual(storage.get_analysis_results(results_ids[1]), ({'score': 2.0}, data_ids[1]))
+
+        results_id = storage.store_analysis_results(data_ids[0], {'segments': {0: 1.0, 1: 0.5}})
+        self.assertEqual(storage.get_analysis_results(results_id), ({'segments': {0: 1.0, 1: 0.5}}, data_ids[0]))
+
+        storage.close()
+        if os.path.exists('data/vocalysis.db'):
+            os.remove('data/vocalysis.db')
+
+    def test_secure_storage_key_setup(self):
+        """Test SecureStorage refuses a missing secret or a damaged salt"""
+        import tempfile
+        from unittest import mock
+        from secure_storage import _load_salt
+
+        with mock.patch.dict(os.environ):
+            os.environ.pop('VOCALYSIS_STORAGE_SECRET', None)
+            with self.assertRaises(ValueError):
+                SecureStorage(storage_type='sqlite')
+
+        with tempfile.TemporaryDirectory() as tmp:
+            salt_path = os.path.join(tmp, '.salt')
+            salt = _load_salt(salt_path)
+            self.assertEqual(len(salt), 16)
+            self.assertEqual(os.stat(salt_path).st_mode & 0o777, 0o600)
+            self.assertEqual(_load_salt(salt_path), salt)
+
+            with open(salt_path, 'wb') as f:
+                f.write(salt[:8])
+            with self.assertRaises(ValueError):
+                _load_salt(salt_path)
+
+    def test_secure_storage_legacy_db(self):
+        """Test SecureStorage reads a database written by the original schema"""
+        import json
+        import sqlite3
+        import uuid
+        from datetime import datetime
+        from cryptography.fernet import Fernet
+        import secure_storage
+
+        if os.path.exists('data/vocalysis.db'):
+            os.remove('data/vocalysis.db')
+        os.makedirs('data', exist_ok=True)
+        key = Fernet.generate_key()
+        data_id = str(uuid.uuid4())
+        results_id = str(uuid.uuid4())
+
+        conn = sqlite3.connect('data/vocalysis.db')
+        conn.execute('CREATE TABLE voice_data (id TEXT PRIMARY KEY, data BLOB, metadata TEXT, created_at TIMESTAMP)')
+        conn.execute('CREATE TABLE model_artifacts (id TEXT PRIMARY KEY, model_type TEXT, data BLOB, metadata TEXT, created_at TIMESTAMP)')
+        conn.execute('CREATE TABLE analysis_results (id TEXT PRIMARY KEY, voice_data_id TEXT, results TEXT, created_at TIMESTAMP, '
+                     'FOREIGN KEY (voice_data_id) REFERENCES voice_data (id))')
+        conn.execute('INSERT INTO voice_data VALUES (?, ?, ?, ?)',
+                     (data_id, Fernet(key).encrypt(b'legacy clip'), json.dumps({'legacy': True}), str(datetime.now())))
+        conn.execute('INSERT INTO analysis_results VALUES (?, ?, ?, ?)',
+                     (results_id, data_id, json.dumps({'score': 3.0}), str(datetime.now())))
+        # Earlier releases stamped version 1 without migrating the tables
+        conn.execute('PRAGMA user_version = 1')
+        conn.commit()
+        conn.close()
+
+        secure_storage._INITIALIZED.discard('data/vocalysis.db')
+        storage = SecureStorage(storage_type='sqlite', encryption_key=key)
+
+        self.assertEqual(storage.get_voice_data(data_id), (b'legacy clip', {'legacy': True}))
+        self.assertEqual(storage.get_voice_data(data_id.replace('-', '')), (b'legacy clip', {'legacy': True}))
+        self.assertEqual(storage.get_analysis_results(results_id), ({'score': 3.0}, data_id))
+
+        new_id = storage.store_voice_data(b'new clip')
+        self.assertEqual(new_id, str(uuid.UUID(new_id)))
+        self.assertEqual(storage.get_voice_data(new_id), (b'new clip', {}))
+
+        storage.close()
+        if os.path.exists('data/vocalysis.db'):
+            os.remove('data/vocalysis.db')
+
     def test_run_vocalysis_analysis(self):
         """Test the complete analysis pipeline"""
         results = run_vocalysis_analysis(
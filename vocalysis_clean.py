@@ -5,17 +5,20 @@
 #
 
 import os
+import copy
+import functools
+import inspect
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import librosa
-import librosa.display
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from torch.utils.data import Dataset, DataLoader
+from torch.utils.data import Dataset, DataLoader, BatchSampler, RandomSampler, SequentialSampler
+from torch.nn.utils.fusion import fuse_conv_bn_eval
 import torchaudio
 import soundfile as sf
+import soxr
 import IPython.display as ipd
 from ipywidgets import widgets, Button, HBox, VBox, Layout
 from IPython.display import display, clear_output
@@ -23,15 +26,16 @@ import time
 import random
 import warnings
 import scipy.signal as signal
+import scipy.fft
+from scipy.ndimage import median_filter
+from numba import njit
+from joblib import Parallel, delayed
 from sklearn.model_selection import train_test_split, KFold
 from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import confusion_matrix, classification_report, accuracy_score, f1_score
 import io
 import base64
 import json
 from datetime import datetime
-from fpdf import FPDF
-from pydub import AudioSegment
 import asyncio
 
 warnings.filterwarnings('ignore')
@@ -43,6 +47,185 @@ random.seed(42)
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 print(f"Using device: {device}")
 
+# Fused attention kernels (flash / memory-efficient) arrived in torch 2.0
+_HAS_SDPA = hasattr(nn.functional, 'scaled_dot_product_attention')
+
+# torch.load gained weights_only in 1.13 and mmap in 2.1; requirements.txt
+# still allows torch 1.9, so only pass the ones this build accepts
+_TORCH_LOAD_KWARGS = {
+    name: True for name in ('mmap', 'weights_only')
+    if name in inspect.signature(torch.load).parameters
+}
+
+# Input shapes are fixed per model (batch_size x num_features), so let cuDNN
+# time its Conv1d algorithms once and keep the fastest
+torch.backends.cudnn.benchmark = True
+
+
+@njit(cache=True, fastmath=True)
+def _validate_stats(x, silent_threshold):
+    """Single-pass signal power, silent-sample power and peak amplitude
+    
+    Args:
+        x (numpy.ndarray): Audio data
+        silent_threshold (float): Amplitude below which a sample counts as silent
+    
+    Returns:
+        tuple: (signal_power, noise_power, num_silent, peak_abs)
+    """
+    total = 0.0
+    noise = 0.0
+    num_silent = 0
+    peak = 0.0
+    for i in range(len(x)):
+        v = x[i]
+        sq = v * v
+        total += sq
+        a = abs(v)
+        if a < silent_threshold:
+            noise += sq
+            num_silent += 1
+        if a > peak:
+            peak = a
+    noise_power = noise / num_silent if num_silent > 0 else 0.0
+    return total / max(len(x), 1), noise_power, num_silent, peak
+
+
+@njit(cache=True)
+def _silence_run_stats(rms, threshold):
+    """Single-pass statistics of runs of frames with RMS below threshold
+    
+    Args:
+        rms (numpy.ndarray): Frame RMS energy
+        threshold (float): RMS below which a frame counts as silent
+    
+    Returns:
+        tuple: (num_runs, total_frames, std_frames, max_frames), run lengths in frames
+    """
+    num_runs = 0
+    total = 0
+    total_sq = 0
+    longest = 0
+    run = 0
+    for i in range(len(rms) + 1):
+        if i < len(rms) and rms[i] < threshold:
+            run += 1
+        elif run > 0:
+            num_runs += 1
+            total += run
+            total_sq += run * run
+            if run > longest:
+                longest = run
+            run = 0
+    if num_runs == 0:
+        return 0, 0, 0.0, 0
+    # Integer sums keep the variance exact: (n * sum(x^2) - sum(x)^2) / n^2
+    var = (num_runs * total_sq - total * total) / (num_runs * num_runs)
+    return num_runs, total, np.sqrt(var), longest
+
+
+@njit(cache=True)
+def _local_peaks(x, height):
+    """Local maxima of x at or above height
+    
+    Same candidates as scipy.signal.find_peaks(x, height=height): strict
+    rises and falls on both sides, with plateaus reporting their middle
+    sample.
+    
+    Args:
+        x (numpy.ndarray): Signal
+        height (float): Minimum peak height
+    
+    Returns:
+        numpy.ndarray: Peak indices in ascending order
+    """
+    n = len(x)
+    peaks = np.empty(max(n // 2, 1), dtype=np.int64)
+    num_peaks = 0
+    i = 1
+    while i < n - 1:
+        if x[i - 1] < x[i]:
+            i_ahead = i + 1
+            while i_ahead < n - 1 and x[i_ahead] == x[i]:
+                i_ahead += 1
+            if x[i_ahead] < x[i]:
+                peak = (i + i_ahead - 1) // 2
+                if x[peak] >= height:
+                    peaks[num_peaks] = peak
+                    num_peaks += 1
+                i = i_ahead
+        i += 1
+    return peaks[:num_peaks]
+
+
+@njit(cache=True)
+def _suppress_close_peaks(peaks, order, distance):
+    """Drop peaks closer than distance to a taller kept peak
+    
+    Mirrors find_peaks' distance rule: walk the peaks from tallest to
+    shortest (order is their argsort by height) and remove any neighbours
+    within distance of each one kept.
+    
+    Args:
+        peaks (numpy.ndarray): Peak indices in ascending order
+        order (numpy.ndarray): Argsort of the peak heights
+        distance (int): Minimum distance between kept peaks
+    
+    Returns:
+        numpy.ndarray: Kept peak indices in ascending order
+    """
+    keep = np.ones(len(peaks), dtype=np.bool_)
+    for p in range(len(peaks) - 1, -1, -1):
+        j = order[p]
+        if not keep[j]:
+            continue
+        k = j - 1
+        while k >= 0 and peaks[j] - peaks[k] < distance:
+            keep[k] = False
+            k -= 1
+        k = j + 1
+        while k < len(peaks) and peaks[k] - peaks[j] < distance:
+            keep[k] = False
+            k += 1
+    return peaks[keep]
+
+
+@njit(cache=True, fastmath=True)
+def _mean_std(values):
+    """Mean and population standard deviation of a short array"""
+    n = len(values)
+    mean = 0.0
+    for i in range(n):
+        mean += values[i]
+    mean /= n
+    var = 0.0
+    for i in range(n):
+        d = values[i] - mean
+        var += d * d
+    return mean, np.sqrt(var / n)
+
+
+@njit(cache=True, fastmath=True)
+def _jitter_stats(pitch_values):
+    """Mean and std of absolute period differences between successive pitches"""
+    jitter = np.empty(len(pitch_values) - 1)
+    prev = 1.0 / (pitch_values[0] + 1e-10)
+    for i in range(1, len(pitch_values)):
+        period = 1.0 / (pitch_values[i] + 1e-10)
+        jitter[i - 1] = abs(period - prev)
+        prev = period
+    return _mean_std(jitter)
+
+
+@njit(cache=True, fastmath=True)
+def _shimmer_stats(peak_amplitudes):
+    """Mean and std of relative amplitude differences between successive peaks"""
+    shimmer = np.empty(len(peak_amplitudes) - 1)
+    for i in range(1, len(peak_amplitudes)):
+        prev = peak_amplitudes[i - 1]
+        shimmer[i - 1] = abs((peak_amplitudes[i] - prev) / (prev + 1e-10))
+    return _mean_std(shimmer)
+
 
 class AudioProcessor:
     """Class for processing audio files for mental health analysis"""
@@ -69,15 +252,16 @@ class AudioProcessor:
             tuple: (audio_data, sample_rate)
         """
         try:
-            if file_path.endswith('.mp3'):
-                audio = AudioSegment.from_mp3(file_path)
-                audio = audio.set_channels(1)  # Convert to mono
-                audio_data = np.array(audio.get_array_of_samples()).astype(np.float32) / 32768.0
-                sample_rate = audio.frame_rate
-            else:  # WAV and other formats supported by librosa
-                audio_data, sample_rate = librosa.load(file_path, sr=None, mono=True)
+            try:
+                # libsndfile decodes WAV, FLAC, OGG and (1.1+) MP3 in-process
+                audio_data, sample_rate = sf.read(file_path, dtype='float32', always_2d=False)
+            except RuntimeError:  # Formats libsndfile cannot decode
+                audio_data, sample_rate = librosa.load(file_path, sr=None, mono=True, dtype=np.float32)
             
-            return audio_data, sample_rate
+            if audio_data.ndim > 1:  # Convert to mono if stereo
+                audio_data = audio_data.mean(axis=1)
+            
+            return audio_data.astype(np.float32, copy=False), sample_rate
         except Exception as e:
             print(f"Error loading audio file: {e}")
             return None, None
@@ -92,10 +276,10 @@ class AudioProcessor:
             tuple: (audio_data, sample_rate)
         """
         try:
-            audio_data, sample_rate = sf.read(io.BytesIO(audio_bytes))
+            audio_data, sample_rate = sf.read(io.BytesIO(audio_bytes), dtype='float32')
             if audio_data.ndim > 1:  # Convert to mono if stereo
                 audio_data = np.mean(audio_data, axis=1)
-            return audio_data, sample_rate
+            return audio_data.astype(np.float32, copy=False), sample_rate
         except Exception as e:
             print(f"Error loading audio from bytes: {e}")
             return None, None
@@ -111,8 +295,8 @@ class AudioProcessor:
             numpy.ndarray: Resampled audio data
         """
         if original_sr != self.target_sr:
-            return librosa.resample(audio_data, orig_sr=original_sr, target_sr=self.target_sr)
-        return audio_data
+            audio_data = soxr.resample(audio_data, original_sr, self.target_sr, quality='HQ')
+        return audio_data.astype(np.float32, copy=False)
     
     def validate_audio(self, audio_data, sr):
         """Validate audio quality
@@ -128,17 +312,15 @@ class AudioProcessor:
         if duration < self.min_duration:
             return False, f"Audio duration ({duration:.2f}s) is less than minimum required ({self.min_duration}s)"
         
-        signal_power = np.mean(audio_data**2)
         silent_threshold = 0.001
-        silent_segments = audio_data[np.abs(audio_data) < silent_threshold]
-        if len(silent_segments) > 0:
-            noise_power = np.mean(silent_segments**2)
+        signal_power, noise_power, num_silent, peak_abs = _validate_stats(audio_data, silent_threshold)
+        if num_silent > 0:
             if noise_power > 0:
                 snr = 10 * np.log10(signal_power / noise_power)
                 if snr < self.snr_threshold:
                     return False, f"Signal-to-noise ratio ({snr:.2f}dB) is below threshold ({self.snr_threshold}dB)"
         
-        if np.max(np.abs(audio_data)) >= 1.0:
+        if peak_abs >= 1.0:
             return False, "Audio contains clipping"
         
         return True, "Audio validation passed"
@@ -159,14 +341,15 @@ class AudioProcessor:
         hop_samples = int(segment_samples * (1 - overlap))
         segments = []
         
-        for i in range(0, len(audio_data) - segment_samples + 1, hop_samples):
-            segment = audio_data[i:i + segment_samples]
-            if np.mean(segment**2) > 0.0001:  # Energy threshold
-                segments.append(segment)
+        if len(audio_data) >= segment_samples:
+            frames = np.lib.stride_tricks.sliding_window_view(audio_data, segment_samples)[::hop_samples]
+            energy = np.einsum('ij,ij->i', frames, frames) / segment_samples
+            for i in np.flatnonzero(energy > 0.0001):  # Energy threshold
+                segments.append(audio_data[i * hop_samples:i * hop_samples + segment_samples])
         
         if len(segments) == 0 and len(audio_data) > 0:
             if len(audio_data) < segment_samples:
-                padded = np.zeros(segment_samples)
+                padded = np.zeros(segment_samples, dtype=audio_data.dtype)
                 padded[:len(audio_data)] = audio_data
                 segments.append(padded)
             else:
@@ -213,6 +396,10 @@ class AudioProcessor:
             sr (int): Sample rate
             title (str): Plot title
         """
+        # Plotting stack is only loaded when something is actually drawn
+        import matplotlib.pyplot as plt
+        import librosa.display
+        
         plt.figure(figsize=(12, 4))
         librosa.display.waveshow(audio_data, sr=sr)
         plt.title(title)
@@ -230,6 +417,38 @@ class AudioProcessor:
         plt.show()
 
 
+def _extract_features_chunk(extractor, segments, spectrograms, mfccs):
+    """Extract features for a contiguous run of segments into one float32 block
+    
+    Rows are written as each segment is processed, so no per-segment
+    dictionaries are kept around (or pickled back from worker processes).
+    extract_features always emits its keys in the same order, so the column
+    layout is fixed by the first segment and later rows are copied by
+    position without per-name lookups.
+    
+    Args:
+        extractor (FeatureExtractor): Extractor to run
+        segments (list): Audio segments
+        spectrograms (list): Matching precomputed spectrograms (or None)
+        mfccs (list): Matching precomputed MFCCs (or None)
+    
+    Returns:
+        tuple: (feature_names, values) with values of shape (len(segments), n_features),
+            or ([], None) for no segments
+    """
+    feature_names = []
+    values = None
+    
+    for i, (segment, S, M) in enumerate(zip(segments, spectrograms, mfccs)):
+        features = extractor.extract_features(segment, S=S, mfccs=M)
+        if values is None:
+            feature_names = list(features.keys())
+            values = np.empty((len(segments), len(feature_names)), dtype=np.float32)
+        values[i] = np.fromiter(features.values(), dtype=np.float32, count=len(feature_names))
+    
+    return feature_names, values
+
+
 class FeatureExtractor:
     """Class for extracting features from audio for mental health analysis"""
     
@@ -241,12 +460,33 @@ class FeatureExtractor:
         """
         self.sr = sr
         self.feature_names = []
+        
+        # STFT window and mel filterbank are fixed for a sample rate, so
+        # build them once instead of on every librosa call
+        self.n_fft = 2048
+        self.hop_length = 512
+        self.window = signal.get_window('hann', self.n_fft)
+        self.mel_fb = librosa.filters.mel(sr=sr, n_fft=self.n_fft, n_mels=128)
+        # Orthonormal DCT-II as a matrix, for MFCCs computed as matmuls on the GPU
+        self.dct_basis = scipy.fft.dct(np.eye(128, dtype=np.float32), type=2, norm='ortho', axis=0)[:13]
+    
+    def spectrogram(self, audio):
+        """Compute the magnitude spectrogram shared by the spectral features
+        
+        Args:
+            audio (numpy.ndarray): Audio data, shape (T,) or (N, T)
+            
+        Returns:
+            numpy.ndarray: Magnitude spectrogram
+        """
+        return np.abs(librosa.stft(audio, n_fft=self.n_fft, hop_length=self.hop_length, window=self.window))
     
-    def extract_time_domain_features(self, audio):
+    def extract_time_domain_features(self, audio, rms=None):
         """Extract time-domain features from audio
         
         Args:
             audio (numpy.ndarray): Audio data
+            rms (numpy.ndarray, optional): Frame RMS energy of audio
             
         Returns:
             dict: Dictionary of time-domain features
@@ -254,13 +494,19 @@ class FeatureExtractor:
         features = {}
         
         hop_length = 512
-        amplitude_envelope = np.array([max(audio[i:i+hop_length]) for i in range(0, len(audio), hop_length)])
+        # Reduce whole hops through a reshaped view (no padded copy of the
+        # audio), then the partial hop at the end, if any
+        n_hops = len(audio) // hop_length
+        amplitude_envelope = audio[:n_hops * hop_length].reshape(n_hops, hop_length).max(axis=1)
+        if len(audio) % hop_length:
+            amplitude_envelope = np.append(amplitude_envelope, audio[n_hops * hop_length:].max())
         features['ae_mean'] = np.mean(amplitude_envelope)
         features['ae_std'] = np.std(amplitude_envelope)
         features['ae_max'] = np.max(amplitude_envelope)
         features['ae_min'] = np.min(amplitude_envelope)
         
-        rms = librosa.feature.rms(y=audio, hop_length=hop_length)[0]
+        if rms is None:
+            rms = librosa.feature.rms(y=audio, hop_length=hop_length)[0]
         features['rms_mean'] = np.mean(rms)
         features['rms_std'] = np.std(rms)
         features['rms_max'] = np.max(rms)
@@ -273,34 +519,27 @@ class FeatureExtractor:
         features['zcr_min'] = np.min(zcr)
         
         silence_threshold = 0.01
-        is_silence = rms < silence_threshold
-        silence_runs = np.diff(np.concatenate([[0], is_silence.astype(int), [0]]))
-        silence_starts = np.where(silence_runs == 1)[0]
-        silence_ends = np.where(silence_runs == -1)[0]
-        silence_durations = silence_ends - silence_starts
-        
-        if len(silence_durations) > 0:
-            features['silence_rate'] = len(silence_durations) / (len(audio) / self.sr)
-            features['silence_mean_duration'] = np.mean(silence_durations) * hop_length / self.sr
-            features['silence_std_duration'] = np.std(silence_durations) * hop_length / self.sr
-            features['silence_max_duration'] = np.max(silence_durations) * hop_length / self.sr
-            features['silence_total_duration'] = np.sum(silence_durations) * hop_length / self.sr
-            features['silence_percentage'] = np.sum(is_silence) / len(is_silence)
-        else:
-            features['silence_rate'] = 0
-            features['silence_mean_duration'] = 0
-            features['silence_std_duration'] = 0
-            features['silence_max_duration'] = 0
-            features['silence_total_duration'] = 0
-            features['silence_percentage'] = 0
+        num_silences, silent_frames, std_frames, max_frames = _silence_run_stats(rms, silence_threshold)
+        
+        # The kernel reports zeros when there are no silent runs, so only the
+        # mean needs a guard
+        frame_seconds = hop_length / self.sr
+        features['silence_rate'] = num_silences / (len(audio) / self.sr)
+        features['silence_mean_duration'] = silent_frames / max(num_silences, 1) * frame_seconds
+        features['silence_std_duration'] = std_frames * frame_seconds
+        features['silence_max_duration'] = max_frames * frame_seconds
+        features['silence_total_duration'] = silent_frames * frame_seconds
+        features['silence_percentage'] = silent_frames / len(rms)
         
         return features
     
-    def extract_frequency_domain_features(self, audio):
+    def extract_frequency_domain_features(self, audio, S=None, mfccs=None):
         """Extract frequency-domain features from audio
         
         Args:
             audio (numpy.ndarray): Audio data
+            S (numpy.ndarray, optional): Magnitude spectrogram of audio
+            mfccs (numpy.ndarray, optional): Precomputed 13 x frames MFCCs of audio
             
         Returns:
             dict: Dictionary of frequency-domain features
@@ -308,47 +547,57 @@ class FeatureExtractor:
         features = {}
         hop_length = 512
         
-        spectral_centroid = librosa.feature.spectral_centroid(y=audio, sr=self.sr, hop_length=hop_length)[0]
+        if S is None:
+            S = self.spectrogram(audio)
+        
+        spectral_centroid = librosa.feature.spectral_centroid(S=S, sr=self.sr)
+        # Bandwidth is spread around the centroid; hand it over rather than
+        # letting librosa recompute it
+        spectral_bandwidth = librosa.feature.spectral_bandwidth(S=S, sr=self.sr, centroid=spectral_centroid)[0]
+        spectral_centroid = spectral_centroid[0]
         features['spectral_centroid_mean'] = np.mean(spectral_centroid)
         features['spectral_centroid_std'] = np.std(spectral_centroid)
         features['spectral_centroid_max'] = np.max(spectral_centroid)
         features['spectral_centroid_min'] = np.min(spectral_centroid)
         
-        spectral_bandwidth = librosa.feature.spectral_bandwidth(y=audio, sr=self.sr, hop_length=hop_length)[0]
         features['spectral_bandwidth_mean'] = np.mean(spectral_bandwidth)
         features['spectral_bandwidth_std'] = np.std(spectral_bandwidth)
         features['spectral_bandwidth_max'] = np.max(spectral_bandwidth)
         features['spectral_bandwidth_min'] = np.min(spectral_bandwidth)
         
-        spectral_rolloff = librosa.feature.spectral_rolloff(y=audio, sr=self.sr, hop_length=hop_length)[0]
+        spectral_rolloff = librosa.feature.spectral_rolloff(S=S, sr=self.sr)[0]
         features['spectral_rolloff_mean'] = np.mean(spectral_rolloff)
         features['spectral_rolloff_std'] = np.std(spectral_rolloff)
         features['spectral_rolloff_max'] = np.max(spectral_rolloff)
         features['spectral_rolloff_min'] = np.min(spectral_rolloff)
         
-        mfccs = librosa.feature.mfcc(y=audio, sr=self.sr, n_mfcc=13, hop_length=hop_length)
+        if mfccs is None:
+            mel_S = self.mel_fb @ (S**2)
+            mfccs = scipy.fft.dct(librosa.power_to_db(mel_S), axis=0, type=2, norm='ortho')[:13]
         for i in range(13):
             features[f'mfcc{i+1}_mean'] = np.mean(mfccs[i])
             features[f'mfcc{i+1}_std'] = np.std(mfccs[i])
             features[f'mfcc{i+1}_max'] = np.max(mfccs[i])
             features[f'mfcc{i+1}_min'] = np.min(mfccs[i])
         
-        spectral_contrast = librosa.feature.spectral_contrast(y=audio, sr=self.sr, hop_length=hop_length)
+        spectral_contrast = librosa.feature.spectral_contrast(S=S, sr=self.sr)
         for i in range(spectral_contrast.shape[0]):
             features[f'spectral_contrast{i+1}_mean'] = np.mean(spectral_contrast[i])
             features[f'spectral_contrast{i+1}_std'] = np.std(spectral_contrast[i])
         
-        spectral_flatness = librosa.feature.spectral_flatness(y=audio, hop_length=hop_length)[0]
+        spectral_flatness = librosa.feature.spectral_flatness(S=S)[0]
         features['spectral_flatness_mean'] = np.mean(spectral_flatness)
         features['spectral_flatness_std'] = np.std(spectral_flatness)
         
         return features
     
-    def extract_prosodic_features(self, audio):
+    def extract_prosodic_features(self, audio, S=None, rms=None):
         """Extract prosodic features from audio
         
         Args:
             audio (numpy.ndarray): Audio data
+            S (numpy.ndarray, optional): Magnitude spectrogram of audio
+            rms (numpy.ndarray, optional): Frame RMS energy of audio
             
         Returns:
             dict: Dictionary of prosodic features
@@ -356,14 +605,14 @@ class FeatureExtractor:
         features = {}
         hop_length = 512
         
-        pitches, magnitudes = librosa.piptrack(y=audio, sr=self.sr, hop_length=hop_length)
-        pitch_values = []
+        if S is None:
+            S = self.spectrogram(audio)
         
-        for t in range(pitches.shape[1]):
-            index = magnitudes[:, t].argmax()
-            pitch = pitches[index, t]
-            if pitch > 0:  # Only consider non-zero pitches
-                pitch_values.append(pitch)
+        pitches, magnitudes = librosa.piptrack(S=S, sr=self.sr, hop_length=hop_length)
+        # Pitch at the strongest bin of each frame
+        index = magnitudes.argmax(axis=0)
+        pitch_values = pitches[index, np.arange(pitches.shape[1])]
+        pitch_values = pitch_values[pitch_values > 0]  # Only consider non-zero pitches
         
         if len(pitch_values) > 0:
             features['pitch_mean'] = np.mean(pitch_values)
@@ -391,9 +640,11 @@ class FeatureExtractor:
             features['pitch_changes_std'] = 0
             features['pitch_changes_max'] = 0
         
-        energy = librosa.feature.rms(y=audio, hop_length=hop_length)[0]
+        energy = rms if rms is not None else librosa.feature.rms(y=audio, hop_length=hop_length)[0]
         energy_threshold = np.mean(energy) * 0.5
-        peaks, _ = signal.find_peaks(energy, height=energy_threshold, distance=8)  # Minimum distance between peaks
+        peaks = _local_peaks(energy, energy_threshold)
+        # numpy's argsort fixes the tie order exactly as scipy's find_peaks would
+        peaks = _suppress_close_peaks(peaks, np.argsort(energy[peaks].astype(np.float64)), 8)  # Minimum distance between peaks
         
         if len(peaks) > 0:
             duration = len(audio) / self.sr
@@ -422,29 +673,28 @@ class FeatureExtractor:
         
         
         if len(pitch_values) > 1:
-            pitch_periods = 1.0 / (np.array(pitch_values) + 1e-10)  # Convert frequency to period
-            jitter_values = np.abs(np.diff(pitch_periods))
-            features['jitter_mean'] = np.mean(jitter_values)
-            features['jitter_std'] = np.std(jitter_values)
+            features['jitter_mean'], features['jitter_std'] = _jitter_stats(pitch_values)
         else:
             features['jitter_mean'] = 0
             features['jitter_std'] = 0
         
         if len(peaks) > 1:
-            peak_amplitudes = energy[peaks]
-            shimmer_values = np.abs(np.diff(peak_amplitudes) / (peak_amplitudes[:-1] + 1e-10))
-            features['shimmer_mean'] = np.mean(shimmer_values)
-            features['shimmer_std'] = np.std(shimmer_values)
+            features['shimmer_mean'], features['shimmer_std'] = _shimmer_stats(energy[peaks])
         else:
             features['shimmer_mean'] = 0
             features['shimmer_std'] = 0
         
-        S = np.abs(librosa.stft(audio, hop_length=hop_length))
-        harmonic_S = librosa.decompose.hpss(S)[0]  # Harmonic component
-        noise_S = S - harmonic_S  # Noise component
+        # Harmonic half of librosa.decompose.hpss(S, kernel_size=31): the
+        # percussive median is still needed for the soft mask, but its own
+        # mask and component are never built
+        harmonic_median = median_filter(S, size=(1, 31), mode='reflect')
+        percussive_median = median_filter(S, size=(31, 1), mode='reflect')
+        harmonic_S = S * librosa.util.softmask(harmonic_median, percussive_median, power=2, split_zeros=True)
+        harmonic_energy = np.einsum('ij,ij->', harmonic_S, harmonic_S)
         
-        harmonic_energy = np.sum(harmonic_S**2)
-        noise_energy = np.sum(noise_S**2)
+        # Reuse the harmonic buffer for the (negated) noise component
+        noise_S = np.subtract(harmonic_S, S, out=harmonic_S)
+        noise_energy = np.einsum('ij,ij->', noise_S, noise_S)
         
         if noise_energy > 0:
             features['hnr'] = 10 * np.log10(harmonic_energy / noise_energy)
@@ -453,20 +703,80 @@ class FeatureExtractor:
         
         return features
     
-    def extract_features(self, audio):
+    def compute_spectrograms(self, audio_segments, n_fft=2048, hop_length=512):
+        """Compute magnitude spectrograms for equal-length segments in one pass
+        
+        Matches librosa.stft defaults (periodic Hann window, centered frames,
+        zero padding). Runs as a single batched torch.stft on the GPU when
+        one is available, otherwise as one multi-channel librosa.stft.
+        
+        Args:
+            audio_segments (list): List of equal-length audio segments
+            n_fft (int): FFT size
+            hop_length (int): Hop length in samples
+            
+        Returns:
+            numpy.ndarray: Magnitude spectrograms, shape (N, 1 + n_fft // 2, frames)
+        """
+        batch = np.stack(audio_segments)
+        
+        if device.type == 'cuda':
+            x = torch.from_numpy(batch).to(device, dtype=torch.float32)
+            window = torch.hann_window(n_fft, periodic=True, device=device)
+            stft = torch.stft(x, n_fft=n_fft, hop_length=hop_length, window=window,
+                              center=True, pad_mode='constant', return_complex=True)
+            return stft.abs().cpu().numpy()
+        
+        if n_fft == self.n_fft and hop_length == self.hop_length:
+            return self.spectrogram(batch)
+        return np.abs(librosa.stft(batch, n_fft=n_fft, hop_length=hop_length))
+    
+    def compute_mfccs(self, spectrograms, device=device):
+        """Compute MFCCs for a batch of spectrograms in one pass with torch
+        
+        Mel projection, power_to_db (ref=1, top_db=80 per segment) and the
+        DCT are all matmuls or elementwise ops, so the whole batch runs as a
+        few kernels on the given device.
+        
+        Args:
+            spectrograms (numpy.ndarray): Magnitude spectrograms, shape (N, 1 + n_fft // 2, frames)
+            device (torch.device): Device to compute on
+            
+        Returns:
+            numpy.ndarray: MFCCs, shape (N, 13, frames)
+        """
+        S = torch.from_numpy(spectrograms).to(device, dtype=torch.float32)
+        mel_fb = torch.from_numpy(self.mel_fb).to(device)
+        dct_basis = torch.from_numpy(self.dct_basis).to(device)
+        
+        log_mel = 10 * torch.log10(torch.clamp(mel_fb @ S.square(), min=1e-10))
+        top = log_mel.amax(dim=(1, 2), keepdim=True)
+        log_mel = torch.maximum(log_mel, top - 80.0)
+        
+        return (dct_basis @ log_mel).cpu().numpy()
+    
+    def extract_features(self, audio, S=None, mfccs=None):
         """Extract comprehensive feature set from audio
         
         Args:
             audio (numpy.ndarray): Audio data
+            S (numpy.ndarray, optional): Precomputed magnitude spectrogram
+            mfccs (numpy.ndarray, optional): Precomputed MFCCs
             
         Returns:
             dict: Dictionary of all extracted features
         """
         features = {'duration': len(audio) / self.sr}
         
-        time_domain_features = self.extract_time_domain_features(audio)
-        frequency_domain_features = self.extract_frequency_domain_features(audio)
-        prosodic_features = self.extract_prosodic_features(audio)
+        # One STFT shared by every spectral feature
+        if S is None:
+            S = self.spectrogram(audio)
+        
+        rms = librosa.feature.rms(y=audio, hop_length=self.hop_length)[0]
+        
+        time_domain_features = self.extract_time_domain_features(audio, rms=rms)
+        frequency_domain_features = self.extract_frequency_domain_features(audio, S=S, mfccs=mfccs)
+        prosodic_features = self.extract_prosodic_features(audio, S=S, rms=rms)
         
         features.update(time_domain_features)
         features.update(frequency_domain_features)
@@ -480,19 +790,55 @@ class FeatureExtractor:
     def extract_features_batch(self, audio_segments):
         """Extract features from multiple audio segments
         
+        Four or more segments are split into contiguous chunks, one per
+        worker process, with at most one worker per CPU core.
+        
         Args:
             audio_segments (list): List of audio segments
             
         Returns:
             pandas.DataFrame: DataFrame of extracted features
         """
-        all_features = []
+        # Segments from AudioProcessor share one length, so their STFTs batch
+        mfccs = [None] * len(audio_segments)
+        if len(audio_segments) > 1 and len({len(segment) for segment in audio_segments}) == 1:
+            spectrograms = self.compute_spectrograms(audio_segments)
+            if device.type == 'cuda':
+                # On the GPU the whole batch's MFCCs are a few matmuls; on the
+                # CPU batching them measured no faster than per segment
+                mfccs = self.compute_mfccs(spectrograms)
+        else:
+            spectrograms = [None] * len(audio_segments)
+        
+        if len(audio_segments) >= 4:
+            # Worker processes sidestep the GIL held by librosa's Python code.
+            # One chunk per worker ships the extractor (and its mel filterbank)
+            # once per process rather than once per segment.
+            n_jobs = min(len(audio_segments), os.cpu_count() or 1)
+            chunks = np.array_split(np.arange(len(audio_segments)), n_jobs)
+            chunk_results = Parallel(n_jobs=n_jobs, backend='loky')(
+                delayed(_extract_features_chunk)(
+                    self,
+                    [audio_segments[i] for i in chunk],
+                    [spectrograms[i] for i in chunk],
+                    [mfccs[i] for i in chunk]
+                )
+                for chunk in chunks
+            )
+            feature_names = chunk_results[0][0]
+            values = np.concatenate([chunk_values for _, chunk_values in chunk_results])
+        else:
+            feature_names, values = _extract_features_chunk(self, audio_segments, spectrograms, mfccs)
+        
+        if values is None:
+            return pd.DataFrame()
         
-        for segment in audio_segments:
-            features = self.extract_features(segment)
-            all_features.append(features)
+        if not self.feature_names:
+            self.feature_names = list(feature_names)
         
-        df = pd.DataFrame(all_features)
+        # Wrap the float32 block directly, instead of having pandas infer
+        # columns and dtypes from a list of dicts
+        df = pd.DataFrame(values, columns=feature_names, copy=False)
         
         return df
     
@@ -511,6 +857,8 @@ class FeatureExtractor:
             features_df (pandas.DataFrame): DataFrame of extracted features
             num_features (int): Number of features to visualize
         """
+        import matplotlib.pyplot as plt
+        
         selected_features = [
             'speech_rate', 'pitch_mean', 'pitch_std', 'rms_mean', 'zcr_mean',
             'spectral_centroid_mean', 'mfcc1_mean', 'mfcc2_mean', 'jitter_mean', 'hnr'
@@ -524,16 +872,14 @@ class FeatureExtractor:
         
         selected_features = selected_features[:num_features]
         
-        normalized_df = features_df[selected_features].copy()
-        for feature in selected_features:
-            min_val = normalized_df[feature].min()
-            max_val = normalized_df[feature].max()
-            if max_val > min_val:
-                normalized_df[feature] = (normalized_df[feature] - min_val) / (max_val - min_val)
-            else:
-                normalized_df[feature] = 0.5  # Default value if all values are the same
+        # Min-max scale every column in one broadcast; constant columns sit at 0.5
+        values = features_df[selected_features].to_numpy(dtype=np.float32)
+        min_vals = np.nanmin(values, axis=0)
+        value_range = np.nanmax(values, axis=0) - min_vals
+        varies = value_range > 0
+        normalized = np.where(varies, (values - min_vals) / np.where(varies, value_range, 1.0), 0.5)
         
-        mean_values = normalized_df.mean().values
+        mean_values = np.nanmean(normalized, axis=0)
         
         angles = np.linspace(0, 2*np.pi, len(selected_features), endpoint=False)
         mean_values = np.concatenate((mean_values, [mean_values[0]]))
@@ -603,41 +949,77 @@ class MentalHealthModel(nn.Module):
             x (torch.Tensor): Input tensor
             
         Returns:
-            tuple: (class_probabilities, confidence)
+            tuple: (class_logits, confidence)
         """
         features = self.feature_extractor(x)
         logits = self.classifier(features)
         confidence = self.confidence(features)
-        return torch.softmax(logits, dim=1), confidence
+        return logits, confidence
+    
+    @torch.no_grad()
+    def fuse_for_inference(self):
+        """Fold each BatchNorm into the preceding Linear layer for inference
+        
+        In eval mode BatchNorm is a fixed per-channel affine transform, so
+        it can be absorbed into the Linear weights and bias. Dropout is a
+        no-op in eval mode and is dropped as well. The model is switched to
+        eval mode and should not be trained afterwards.
+        
+        Returns:
+            MentalHealthModel: self, with a fused feature extractor
+        """
+        self.eval()
+        
+        layers = []
+        modules = list(self.feature_extractor)
+        i = 0
+        while i < len(modules):
+            module = modules[i]
+            next_module = modules[i + 1] if i + 1 < len(modules) else None
+            if isinstance(module, nn.Linear) and isinstance(next_module, nn.BatchNorm1d):
+                scale = next_module.weight / torch.sqrt(next_module.running_var + next_module.eps)
+                fused = nn.Linear(module.in_features, module.out_features).to(module.weight.device)
+                fused.weight.copy_(module.weight * scale[:, None])
+                fused.bias.copy_((module.bias - next_module.running_mean) * scale + next_module.bias)
+                layers.append(fused)
+                i += 2
+            elif isinstance(module, nn.Dropout):
+                i += 1
+            else:
+                layers.append(module)
+                i += 1
+        
+        self.feature_extractor = nn.Sequential(*layers).eval()
+        return self
 
 
+# Score weights for [normal, anxiety, depression, stress]
+SCORE_WEIGHTS = np.array([1.0, -0.5, -0.5, -0.5])
+
 def calculate_mental_health_score(probabilities, confidence):
     """Calculate 0-100 mental health score
     
     Args:
-        probabilities (torch.Tensor or numpy.ndarray): Class probabilities [normal, anxiety, depression, stress]
-        confidence (float): Confidence score
+        probabilities (torch.Tensor or numpy.ndarray): Class probabilities [normal, anxiety, depression, stress],
+            shape (4,) or (batch, 4)
+        confidence (float, torch.Tensor or numpy.ndarray): Confidence score, scalar or shape (batch,)
     
     Returns:
-        float: Mental health score (0-100)
+        float, torch.Tensor or numpy.ndarray: Mental health score (0-100), one per row for batched input
     """
-    normal_weight = 1.0
-    anxiety_weight = -0.5
-    depression_weight = -0.5
-    stress_weight = -0.5
-    
-    base_score = (
-        probabilities[0] * normal_weight + 
-        probabilities[1] * anxiety_weight + 
-        probabilities[2] * depression_weight +
-        probabilities[3] * stress_weight
-    )
+    if isinstance(probabilities, torch.Tensor):
+        weights = torch.as_tensor(SCORE_WEIGHTS, dtype=probabilities.dtype, device=probabilities.device)
+        base_score = probabilities @ weights
+        adjusted_score = (base_score + 0.5) * 100 * (0.7 + 0.3 * confidence)
+        return torch.clamp(adjusted_score, 0, 100)
+    
+    base_score = np.asarray(probabilities) @ SCORE_WEIGHTS
     
     scaled_score = (base_score + 0.5) * 100
     
-    adjusted_score = scaled_score * (0.7 + 0.3 * confidence)
+    adjusted_score = scaled_score * (0.7 + 0.3 * np.asarray(confidence))
     
-    return max(0, min(100, adjusted_score))
+    return np.clip(adjusted_score, 0, 100)
 
 
 def generate_synthetic_data(num_samples=1000, num_features=100):
@@ -650,36 +1032,26 @@ def generate_synthetic_data(num_samples=1000, num_features=100):
     Returns:
         tuple: (features, labels)
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
-    normal_mean = np.zeros(num_features)
-    anxiety_mean = np.zeros(num_features)
-    depression_mean = np.zeros(num_features)
-    stress_mean = np.zeros(num_features)
+    class_means = np.zeros((4, num_features), dtype=np.float32)  # normal, anxiety, depression, stress
     
-    anxiety_mean[10:20] = 0.5  # Higher speech rate, vocal tension
+    class_means[1, 10:20] = 0.5  # Higher speech rate, vocal tension
     
-    depression_mean[20:30] = -0.5  # Lower energy, monotonous speech
+    class_means[2, 20:30] = -0.5  # Lower energy, monotonous speech
     
-    stress_mean[30:40] = 0.4  # Higher jitter, irregular rhythm
+    class_means[3, 30:40] = 0.4  # Higher jitter, irregular rhythm
     
     samples_per_class = num_samples // 4
     
-    normal_data = np.random.normal(loc=normal_mean, scale=0.1, size=(samples_per_class, num_features))
-    anxiety_data = np.random.normal(loc=anxiety_mean, scale=0.1, size=(samples_per_class, num_features))
-    depression_data = np.random.normal(loc=depression_mean, scale=0.1, size=(samples_per_class, num_features))
-    stress_data = np.random.normal(loc=stress_mean, scale=0.1, size=(samples_per_class, num_features))
+    # One draw for the whole matrix, then shift each class block in place
+    features = rng.standard_normal((4 * samples_per_class, num_features), dtype=np.float32)
+    features *= 0.1
+    labels = np.repeat(np.arange(4, dtype=np.int64), samples_per_class)
+    for label in range(4):
+        features[label * samples_per_class:(label + 1) * samples_per_class] += class_means[label]
     
-    features = np.vstack([normal_data, anxiety_data, depression_data, stress_data])
-    
-    labels = np.concatenate([
-        np.zeros(samples_per_class),
-        np.ones(samples_per_class),
-        np.ones(samples_per_class) * 2,
-        np.ones(samples_per_class) * 3
-    ]).astype(int)
-    
-    indices = np.random.permutation(len(features))
+    indices = rng.permutation(len(features))
     features = features[indices]
     labels = labels[indices]
     
@@ -697,8 +1069,9 @@ class MentalHealthDataset(Dataset):
             labels (numpy.ndarray, optional): Labels
             transform (callable, optional): Transform to apply to features
         """
-        self.features = features
-        self.labels = labels
+        # Convert once up front; __getitem__ then returns zero-copy row views
+        self.features = torch.from_numpy(np.ascontiguousarray(features, dtype=np.float32))
+        self.labels = torch.from_numpy(np.asarray(labels)).long() if labels is not None else None
         self.transform = transform
     
     def __len__(self):
@@ -713,7 +1086,7 @@ class MentalHealthDataset(Dataset):
         """Get a sample
         
         Args:
-            idx (int): Index
+            idx (int or list): Index, or a list of indices for a whole batch
             
         Returns:
             tuple: (features, label) or features
@@ -724,12 +1097,299 @@ class MentalHealthDataset(Dataset):
             features = self.transform(features)
         
         if self.labels is not None:
-            return torch.FloatTensor(features), self.labels[idx]
+            return features, self.labels[idx]
         else:
-            return torch.FloatTensor(features)
+            return features
+    
+    def to(self, device):
+        """Move the whole dataset to a device in one transfer
+        
+        Small datasets that are trained on repeatedly (e.g. by every member
+        of an ensemble) can then be batched on the device directly instead
+        of copying each batch from host memory.
+        
+        Args:
+            device (torch.device): Target device
+            
+        Returns:
+            MentalHealthDataset: self
+        """
+        self.features = self.features.to(device)
+        if self.labels is not None:
+            self.labels = self.labels.to(device)
+        return self
 
 
-def train_model(model, train_loader, val_loader, num_epochs=50, lr=0.001, device=torch.device("cpu")):
+def predict_proba(model, x):
+    """Run a model and turn its class logits into probabilities
+    
+    Models return raw logits so training can feed them straight to
+    CrossEntropyLoss; inference callers go through this instead.
+    
+    Args:
+        model (nn.Module): Any of the mental health models
+        x (torch.Tensor): Input tensor
+    
+    Returns:
+        tuple: (class_probabilities, confidence)
+    """
+    logits, confidence = model(x)
+    return torch.softmax(logits.float(), dim=1), confidence
+
+
+def amp_settings(device=device):
+    """Mixed-precision settings for forward passes on a device
+    
+    CUDA runs in BF16 where supported (no loss scaling needed), otherwise
+    FP16; everything else stays in FP32.
+    
+    Args:
+        device (torch.device): Device the model runs on
+    
+    Returns:
+        tuple: (use_amp, amp_dtype) for torch.autocast(enabled=..., dtype=...)
+    """
+    use_amp = device.type == 'cuda'
+    amp_dtype = torch.bfloat16 if use_amp and torch.cuda.is_bf16_supported() else torch.float16
+    return use_amp, amp_dtype
+
+
+class _ModelWrapper(nn.Module):
+    """Base for wrappers that only change how a model's forward runs
+    
+    Attribute lookups the wrapper does not answer itself fall through to
+    the wrapped model, and state_dict/load_state_dict use the wrapped
+    model's keys, so a wrapped model can be saved and reloaded like the
+    bare one.
+    """
+    
+    def __getattr__(self, name):
+        """Look name up on the wrapper, then on the wrapped model"""
+        try:
+            return super().__getattr__(name)
+        except AttributeError:
+            return getattr(super().__getattr__('model'), name)
+    
+    def state_dict(self, *args, **kwargs):
+        """Return the wrapped model's state_dict, without a 'model.' prefix"""
+        return self.model.state_dict(*args, **kwargs)
+    
+    def load_state_dict(self, state_dict, *args, **kwargs):
+        """Load a bare model's state_dict into the wrapped model"""
+        return self.model.load_state_dict(state_dict, *args, **kwargs)
+
+
+class AutocastModel(_ModelWrapper):
+    """Run a model's forward under autocast with the amp_settings for its device
+    
+    Parameters stay in FP32; matmuls run in BF16/FP16 on tensor cores and
+    callers keep passing FP32 inputs.
+    """
+    
+    def __init__(self, model, device=device):
+        """Initialize the wrapper
+        
+        Args:
+            model (nn.Module): Model to wrap
+            device (torch.device): Device the model runs on
+        """
+        super().__init__()
+        
+        self.model = model
+        self.use_amp, self.amp_dtype = amp_settings(device)
+        self.device_type = device.type
+    
+    def forward(self, x):
+        """Forward pass
+        
+        Args:
+            x (torch.Tensor): Input tensor
+            
+        Returns:
+            tuple: The wrapped model's (class_logits, confidence)
+        """
+        with torch.autocast(device_type=self.device_type, dtype=self.amp_dtype, enabled=self.use_amp):
+            return self.model(x)
+
+
+class InferenceModel(_ModelWrapper):
+    """Run a model's forward under torch.inference_mode
+    
+    For models that are only ever used for prediction: callers get the
+    autograd-free fast path without wrapping each call themselves. Outputs
+    are inference tensors and cannot be used in autograd.
+    """
+    
+    def __init__(self, model):
+        """Initialize the wrapper
+        
+        Args:
+            model (nn.Module): Model to wrap
+        """
+        super().__init__()
+        
+        self.model = model
+    
+    def forward(self, x):
+        """Forward pass
+        
+        Args:
+            x (torch.Tensor): Input tensor
+            
+        Returns:
+            tuple: The wrapped model's (class_logits, confidence)
+        """
+        with torch.inference_mode():
+            return self.model(x)
+
+
+def create_data_loader(dataset, batch_size=32, shuffle=False, device=device, num_workers=0):
+    """Build a DataLoader for training or evaluation
+    
+    Batches are assembled in pinned host memory when the target device is
+    CUDA, so the non_blocking copies in train_model and evaluate_model can
+    overlap with compute. Worker processes, when requested, are kept alive
+    across epochs with a small prefetch queue. A MentalHealthDataset
+    without a per-sample transform is read a whole batch at a time, with
+    one index into its feature tensor instead of a fetch and stack per row;
+    if it has already been moved to the GPU its batches are not pinned.
+    
+    Args:
+        dataset (Dataset): Dataset to load from
+        batch_size (int): Batch size
+        shuffle (bool): Reshuffle every epoch
+        device (torch.device): Device the batches will be moved to
+        num_workers (int): Loader worker processes; 0 loads in the main process,
+            which is fastest for in-memory tensor datasets
+    
+    Returns:
+        DataLoader: Configured data loader
+    """
+    worker_options = {}
+    if num_workers > 0:
+        worker_options = {'persistent_workers': True, 'prefetch_factor': 2}
+    
+    if isinstance(dataset, MentalHealthDataset) and dataset.transform is None:
+        # Same sampler and batch order as batch_size/shuffle would give
+        sampler = RandomSampler(dataset) if shuffle else SequentialSampler(dataset)
+        return DataLoader(
+            dataset, sampler=BatchSampler(sampler, batch_size, drop_last=False), batch_size=None,
+            pin_memory=device.type == 'cuda' and not dataset.features.is_cuda,
+            num_workers=num_workers, **worker_options
+        )
+    
+    return DataLoader(
+        dataset, batch_size=batch_size, shuffle=shuffle, pin_memory=device.type == 'cuda',
+        num_workers=num_workers, **worker_options
+    )
+
+
+def update_confusion_matrix(conf_matrix, preds, labels):
+    """Add a batch of predictions to a confusion matrix, on its device
+    
+    Args:
+        conf_matrix (torch.Tensor): (num_classes, num_classes) int64 counts, rows are true labels
+        preds (torch.Tensor): Predicted class indices
+        labels (torch.Tensor): True class indices
+    
+    Returns:
+        torch.Tensor: The updated confusion matrix
+    """
+    num_classes = conf_matrix.size(0)
+    conf_matrix += torch.bincount(labels * num_classes + preds, minlength=num_classes ** 2).view(num_classes, num_classes)
+    return conf_matrix
+
+
+def confusion_matrix_metrics(conf_matrix):
+    """Accuracy and support-weighted F1 from a confusion matrix
+    
+    Matches sklearn's accuracy_score and f1_score(average='weighted').
+    
+    Args:
+        conf_matrix (torch.Tensor): (num_classes, num_classes) counts, rows are true labels
+    
+    Returns:
+        tuple: (accuracy, weighted_f1) as floats
+    """
+    conf_matrix = conf_matrix.double()
+    true_positives = conf_matrix.diagonal()
+    support = conf_matrix.sum(dim=1)
+    predicted = conf_matrix.sum(dim=0)
+    
+    denominator = support + predicted
+    f1 = torch.where(denominator > 0, 2 * true_positives / denominator.clamp(min=1), torch.zeros_like(denominator))
+    
+    accuracy = true_positives.sum() / conf_matrix.sum()
+    weighted_f1 = (f1 * support).sum() / support.sum()
+    
+    accuracy, weighted_f1 = torch.stack([accuracy, weighted_f1]).tolist()
+    return accuracy, weighted_f1
+
+
+def confusion_matrix_report(conf_matrix):
+    """Per-class precision/recall/F1 from a confusion matrix
+    
+    Same layout and values as sklearn's classification_report(..., labels=
+    range(num_classes), output_dict=True, zero_division=0), without another
+    pass over the label arrays.
+    
+    Args:
+        conf_matrix (numpy.ndarray): (num_classes, num_classes) counts, rows are true labels
+    
+    Returns:
+        dict: Per-class metrics keyed by class index as str, plus 'accuracy',
+            'macro avg' and 'weighted avg'
+    """
+    conf_matrix = np.asarray(conf_matrix, dtype=np.float64)
+    true_positives = np.diag(conf_matrix)
+    support = conf_matrix.sum(axis=1)
+    predicted = conf_matrix.sum(axis=0)
+    
+    precision = true_positives / np.maximum(predicted, 1)
+    recall = true_positives / np.maximum(support, 1)
+    f1 = 2 * true_positives / np.maximum(support + predicted, 1)
+    
+    metrics = np.stack([precision, recall, f1], axis=1)
+    total = support.sum()
+    
+    report = {
+        str(i): {'precision': p, 'recall': r, 'f1-score': f, 'support': float(n)}
+        for i, ((p, r, f), n) in enumerate(zip(metrics.tolist(), support.tolist()))
+    }
+    report['accuracy'] = float(true_positives.sum() / total) if total else 0.0
+    for name, averaged in (('macro avg', metrics.mean(axis=0)),
+                           ('weighted avg', support @ metrics / total if total else np.zeros(3))):
+        p, r, f = averaged.tolist()
+        report[name] = {'precision': p, 'recall': r, 'f1-score': f, 'support': float(total)}
+    
+    return report
+
+
+def compile_model(model, device=device):
+    """Compile a model's forward pass with torch.compile where available
+    
+    The compiled module shares parameters with the original, so state_dict,
+    train()/eval() and optimizers keep working on the original model. CUDA
+    uses 'reduce-overhead' (CUDA graphs) to cut per-batch launch cost.
+    
+    Args:
+        model (nn.Module): Model to compile
+        device (torch.device): Device the model runs on
+    
+    Returns:
+        nn.Module: Compiled module, or the model itself if torch.compile is unavailable
+    """
+    if not hasattr(torch, 'compile'):
+        return model
+    
+    try:
+        return torch.compile(model, mode='reduce-overhead' if device.type == 'cuda' else 'default')
+    except Exception as e:
+        print(f"torch.compile unavailable, running eagerly: {str(e)}")
+        return model
+
+
+def train_model(model, train_loader, val_loader, num_epochs=50, lr=0.001, device=torch.device("cpu"), use_compile=False):
     """Train the mental health classification model
     
     Args:
@@ -739,17 +1399,25 @@ def train_model(model, train_loader, val_loader, num_epochs=50, lr=0.001, device
         num_epochs (int): Number of epochs
         lr (float): Learning rate
         device (torch.device): Device to use for training
+        use_compile (bool): Run forward passes through torch.compile; pays a
+            one-off compilation cost, so only worthwhile for long runs
     
     Returns:
         tuple: (trained_model, training_history)
     """
     model = model.to(device)
+    forward = compile_model(model, device) if use_compile else model
     
     criterion = nn.CrossEntropyLoss()
     optimizer = optim.Adam(model.parameters(), lr=lr)
     
     scheduler = optim.lr_scheduler.ReduceLROnPlateau(optimizer, mode='min', factor=0.5, patience=5, verbose=True)
     
+    # Mixed precision on CUDA; FP16 additionally needs a GradScaler.
+    # CPU training stays in FP32.
+    use_amp, amp_dtype = amp_settings(device)
+    scaler = torch.cuda.amp.GradScaler(enabled=use_amp and amp_dtype == torch.float16)
+    
     history = {
         'train_loss': [],
         'val_loss': [],
@@ -764,45 +1432,49 @@ def train_model(model, train_loader, val_loader, num_epochs=50, lr=0.001, device
     
     for epoch in range(num_epochs):
         model.train()
-        train_loss = 0.0
+        # Accumulate on the device; .item() per step would force a sync
+        train_loss = torch.zeros((), device=device)
         
         for features, labels in train_loader:
-            features, labels = features.to(device), labels.to(device)
+            features, labels = features.to(device, non_blocking=True), labels.to(device, non_blocking=True)
             
-            optimizer.zero_grad()
+            optimizer.zero_grad(set_to_none=True)
             
-            outputs, confidence = model(features)
-            loss = criterion(outputs, labels)
+            with torch.autocast(device_type=device.type, dtype=amp_dtype, enabled=use_amp):
+                outputs, confidence = forward(features)
+                loss = criterion(outputs, labels)
             
-            loss.backward()
-            optimizer.step()
+            scaler.scale(loss).backward()
+            scaler.step(optimizer)
+            scaler.update()
             
-            train_loss += loss.item() * features.size(0)
+            train_loss += loss.detach() * features.size(0)
         
-        train_loss = train_loss / len(train_loader.dataset)
+        train_loss = train_loss.item() / len(train_loader.dataset)
         history['train_loss'].append(train_loss)
         
         model.eval()
-        val_loss = 0.0
-        all_preds = []
-        all_labels = []
+        val_loss = torch.zeros((), device=device)
+        val_conf_matrix = None
         
-        with torch.no_grad():
+        with torch.inference_mode():
             for features, labels in val_loader:
-                features, labels = features.to(device), labels.to(device)
+                features, labels = features.to(device, non_blocking=True), labels.to(device, non_blocking=True)
                 
-                outputs, confidence = model(features)
-                loss = criterion(outputs, labels)
+                with torch.autocast(device_type=device.type, dtype=amp_dtype, enabled=use_amp):
+                    outputs, confidence = forward(features)
+                    loss = criterion(outputs, labels)
                 
-                val_loss += loss.item() * features.size(0)
+                val_loss += loss.float() * features.size(0)
                 
-                _, preds = torch.max(outputs, 1)
-                all_preds.extend(preds.cpu().numpy())
-                all_labels.extend(labels.cpu().numpy())
+                preds = outputs.argmax(dim=1)
+                if val_conf_matrix is None:
+                    num_classes = outputs.size(1)
+                    val_conf_matrix = torch.zeros(num_classes, num_classes, dtype=torch.int64, device=device)
+                update_confusion_matrix(val_conf_matrix, preds, labels)
         
-        val_loss = val_loss / len(val_loader.dataset)
-        val_accuracy = accuracy_score(all_labels, all_preds)
-        val_f1 = f1_score(all_labels, all_preds, average='weighted')
+        val_loss = val_loss.item() / len(val_loader.dataset)
+        val_accuracy, val_f1 = confusion_matrix_metrics(val_conf_matrix)
         
         history['val_loss'].append(val_loss)
         history['val_accuracy'].append(val_accuracy)
@@ -815,7 +1487,18 @@ def train_model(model, train_loader, val_loader, num_epochs=50, lr=0.001, device
         if val_loss < best_val_loss:
             best_val_loss = val_loss
             patience_counter = 0
-            best_model_state = model.state_dict().copy()
+            # Snapshot the weights on the host; state_dict() alone only
+            # references the live tensors that the next step overwrites.
+            # The host buffers are allocated on the first improvement and
+            # overwritten in place on later ones.
+            state = model.state_dict()
+            if best_model_state is None:
+                best_model_state = {
+                    k: torch.empty(v.shape, dtype=v.dtype, pin_memory=device.type == 'cuda')
+                    for k, v in state.items()
+                }
+            for k, v in state.items():
+                best_model_state[k].copy_(v.detach(), non_blocking=True)
         else:
             patience_counter += 1
             if patience_counter >= patience:
@@ -828,45 +1511,70 @@ def train_model(model, train_loader, val_loader, num_epochs=50, lr=0.001, device
     return model, history
 
 
-def evaluate_model(model, test_loader, device=torch.device("cpu")):
+def evaluate_model(model, test_loader, device=torch.device("cpu"), use_compile=False):
     """Evaluate the model on test data
     
     Args:
         model (nn.Module): Model to evaluate
         test_loader (DataLoader): Test data loader
         device (torch.device): Device to use for evaluation
+        use_compile (bool): Run forward passes through torch.compile
     
     Returns:
         dict: Evaluation metrics
     """
     model.eval()
-    all_preds = []
-    all_labels = []
-    all_probs = []
-    all_confidences = []
-    
-    with torch.no_grad():
+    forward = compile_model(model, device) if use_compile else model
+    n_samples = len(test_loader.dataset)
+    all_preds = torch.empty(n_samples, dtype=torch.long, device=device)
+    all_labels = torch.empty(n_samples, dtype=torch.long, device=device)
+    all_probs = None
+    all_confidences = None
+    conf_matrix = None
+    offset = 0
+    
+    # Half-precision forward passes on CUDA, as in train_model
+    use_amp, amp_dtype = amp_settings(device)
+    
+    with torch.inference_mode():
         for features, labels in test_loader:
-            features, labels = features.to(device), labels.to(device)
+            features, labels = features.to(device, non_blocking=True), labels.to(device, non_blocking=True)
             
-            probs, confidence = model(features)
+            with torch.autocast(device_type=device.type, dtype=amp_dtype, enabled=use_amp):
+                logits, confidence = forward(features)
             
-            _, preds = torch.max(probs, 1)
+            preds = logits.argmax(dim=1)
+            probs = torch.softmax(logits.float(), dim=1)
             
-            all_preds.extend(preds.cpu().numpy())
-            all_labels.extend(labels.cpu().numpy())
-            all_probs.extend(probs.cpu().numpy())
-            all_confidences.extend(confidence.cpu().numpy())
-    
-    accuracy = accuracy_score(all_labels, all_preds)
-    f1 = f1_score(all_labels, all_preds, average='weighted')
-    conf_matrix = confusion_matrix(all_labels, all_preds)
-    class_report = classification_report(all_labels, all_preds, output_dict=True)
-    
-    mental_health_scores = []
-    for probs, conf in zip(all_probs, all_confidences):
-        score = calculate_mental_health_score(probs, conf[0])
-        mental_health_scores.append(score)
+            # Output widths are only known once the model has run; the
+            # buffers stay FP32 so reported probabilities keep full precision
+            if all_probs is None:
+                all_probs = probs.new_empty((n_samples, probs.size(1)), dtype=torch.float32)
+                all_confidences = confidence.new_empty((n_samples, confidence.size(1)), dtype=torch.float32)
+                num_classes = probs.size(1)
+                conf_matrix = torch.zeros(num_classes, num_classes, dtype=torch.int64, device=device)
+            
+            update_confusion_matrix(conf_matrix, preds, labels)
+            
+            end = offset + labels.size(0)
+            all_preds[offset:end] = preds
+            all_labels[offset:end] = labels
+            all_probs[offset:end] = probs
+            all_confidences[offset:end] = confidence
+            offset = end
+    
+    # One device-to-host copy per output instead of one per batch
+    all_preds = all_preds[:offset].cpu().numpy()
+    all_labels = all_labels[:offset].cpu().numpy()
+    all_probs = all_probs[:offset].cpu().numpy()
+    all_confidences = all_confidences[:offset].cpu().numpy()
+    
+    # Accuracy and F1 come from the C x C matrix built on the device
+    accuracy, f1 = confusion_matrix_metrics(conf_matrix)
+    conf_matrix = conf_matrix.cpu().numpy()
+    class_report = confusion_matrix_report(conf_matrix)
+    
+    mental_health_scores = calculate_mental_health_score(all_probs, all_confidences[:, 0]).tolist()
     
     return {
         'accuracy': accuracy,
@@ -890,6 +1598,59 @@ clinical_thresholds = {
     'hnr': {'low': 10.0, 'high': 20.0}
 }
 
+# (feature, threshold side, template) in reporting order; a feature's low and
+# high rules are mutually exclusive
+INTERPRETATION_RULES = (
+    ('speech_rate', 'low',
+     "Speech rate is slow ({:.2f} syllables/sec), "
+     "which may indicate reduced cognitive processing speed, fatigue, "
+     "or possible depression."),
+    ('speech_rate', 'high',
+     "Speech rate is elevated ({:.2f} syllables/sec), "
+     "which may indicate heightened arousal, anxiety, or agitation."),
+    ('pitch_std', 'low',
+     "Low pitch variability ({:.2f} Hz), "
+     "which may indicate emotional flattening, reduced expressivity, "
+     "or possible depression."),
+    ('pitch_std', 'high',
+     "High pitch variability ({:.2f} Hz), "
+     "which may indicate emotional lability, heightened reactivity, "
+     "or possible anxiety."),
+    ('rms_mean', 'low',
+     "Low voice energy ({:.2f}), "
+     "which may indicate low motivation, fatigue, "
+     "or possible depression."),
+    ('rms_mean', 'high',
+     "High voice energy ({:.2f}), "
+     "which may indicate agitation, heightened arousal, "
+     "or possible mania/anxiety."),
+    ('silence_rate', 'low',
+     "Few pauses in speech ({:.2f} pauses/sec), "
+     "which may indicate pressured speech, racing thoughts, "
+     "or possible anxiety/mania."),
+    ('silence_rate', 'high',
+     "Frequent pauses in speech ({:.2f} pauses/sec), "
+     "which may indicate cognitive slowing, word-finding difficulties, "
+     "or possible depression."),
+    ('jitter_mean', 'high',
+     "High vocal jitter ({:.4f}), "
+     "which may indicate vocal tension, physiological stress, "
+     "or possible anxiety."),
+    ('hnr', 'low',
+     "Low harmonic-to-noise ratio ({:.2f} dB), "
+     "which may indicate increased vocal noise, reduced vocal control, "
+     "or possible stress/anxiety."),
+)
+
+# INTERPRETATION_RULES with each threshold looked up and each template's
+# bound format method taken once at import:
+# (feature, threshold, fires below threshold, format)
+_THRESHOLD_RULES = tuple(
+    (feature, clinical_thresholds[feature][side], side == 'low', template.format)
+    for feature, side, template in INTERPRETATION_RULES
+    if feature in clinical_thresholds
+)
+
 def interpret_features(features):
     """Generate clinical interpretations from voice features
     
@@ -901,80 +1662,82 @@ def interpret_features(features):
     """
     interpretations = []
     
-    if 'speech_rate' in features and 'speech_rate' in clinical_thresholds:
-        if features['speech_rate'] < clinical_thresholds['speech_rate']['low']:
-            interpretations.append(
-                f"Speech rate is slow ({features['speech_rate']:.2f} syllables/sec), "
-                f"which may indicate reduced cognitive processing speed, fatigue, "
-                f"or possible depression."
-            )
-        elif features['speech_rate'] > clinical_thresholds['speech_rate']['high']:
-            interpretations.append(
-                f"Speech rate is elevated ({features['speech_rate']:.2f} syllables/sec), "
-                f"which may indicate heightened arousal, anxiety, or agitation."
-            )
+    for feature, threshold, below, format_interpretation in _THRESHOLD_RULES:
+        if feature in features:
+            value = features[feature]
+            if value < threshold if below else value > threshold:
+                interpretations.append(format_interpretation(value))
     
-    if 'pitch_std' in features and 'pitch_std' in clinical_thresholds:
-        if features['pitch_std'] < clinical_thresholds['pitch_std']['low']:
-            interpretations.append(
-                f"Low pitch variability ({features['pitch_std']:.2f} Hz), "
-                f"which may indicate emotional flattening, reduced expressivity, "
-                f"or possible depression."
-            )
-        elif features['pitch_std'] > clinical_thresholds['pitch_std']['high']:
-            interpretations.append(
-                f"High pitch variability ({features['pitch_std']:.2f} Hz), "
-                f"which may indicate emotional lability, heightened reactivity, "
-                f"or possible anxiety."
-            )
+    return interpretations
+
+
+def interpret_features_batch(features_df):
+    """Generate clinical interpretations for many feature rows at once
     
-    if 'rms_mean' in features and 'rms_mean' in clinical_thresholds:
-        if features['rms_mean'] < clinical_thresholds['rms_mean']['low']:
-            interpretations.append(
-                f"Low voice energy ({features['rms_mean']:.2f}), "
-                f"which may indicate low motivation, fatigue, "
-                f"or possible depression."
-            )
-        elif features['rms_mean'] > clinical_thresholds['rms_mean']['high']:
-            interpretations.append(
-                f"High voice energy ({features['rms_mean']:.2f}), "
-                f"which may indicate agitation, heightened arousal, "
-                f"or possible mania/anxiety."
-            )
+    Each rule is evaluated as a mask over a whole feature column; strings
+    are only formatted for the rows that cross a threshold.
     
-    if 'silence_rate' in features and 'silence_rate' in clinical_thresholds:
-        if features['silence_rate'] < clinical_thresholds['silence_rate']['low']:
-            interpretations.append(
-                f"Few pauses in speech ({features['silence_rate']:.2f} pauses/sec), "
-                f"which may indicate pressured speech, racing thoughts, "
-                f"or possible anxiety/mania."
-            )
-        elif features['silence_rate'] > clinical_thresholds['silence_rate']['high']:
-            interpretations.append(
-                f"Frequent pauses in speech ({features['silence_rate']:.2f} pauses/sec), "
-                f"which may indicate cognitive slowing, word-finding difficulties, "
-                f"or possible depression."
-            )
+    Args:
+        features_df (pandas.DataFrame): One row of extracted features per subject
     
-    if 'jitter_mean' in features and 'jitter_mean' in clinical_thresholds:
-        if features['jitter_mean'] > clinical_thresholds['jitter_mean']['high']:
-            interpretations.append(
-                f"High vocal jitter ({features['jitter_mean']:.4f}), "
-                f"which may indicate vocal tension, physiological stress, "
-                f"or possible anxiety."
-            )
+    Returns:
+        list: One list of clinical interpretations per row, as interpret_features
+    """
+    interpretations = [[] for _ in range(len(features_df))]
     
-    if 'hnr' in features and 'hnr' in clinical_thresholds:
-        if features['hnr'] < clinical_thresholds['hnr']['low']:
-            interpretations.append(
-                f"Low harmonic-to-noise ratio ({features['hnr']:.2f} dB), "
-                f"which may indicate increased vocal noise, reduced vocal control, "
-                f"or possible stress/anxiety."
-            )
+    for feature, threshold, below, format_interpretation in _THRESHOLD_RULES:
+        if feature not in features_df.columns:
+            continue
+        values = features_df[feature].to_numpy()
+        for i in np.flatnonzero(values < threshold if below else values > threshold):
+            interpretations[i].append(format_interpretation(values[i]))
     
     return interpretations
 
 
+# Band edges (lower bound of every band but the first) and labels per scale
+SCALE_BANDS = {
+    'GAD-7': ((5, 10, 15),
+              ("Minimal anxiety", "Mild anxiety", "Moderate anxiety", "Severe anxiety")),
+    'PHQ-9': ((5, 10, 15, 20),
+              ("Minimal depression", "Mild depression", "Moderate depression",
+               "Moderately severe depression", "Severe depression")),
+    'PSS': ((14, 27),
+            ("Low perceived stress", "Moderate perceived stress", "High perceived stress")),
+    'WEMWBS': ((40, 59),
+               ("Low mental wellbeing", "Average mental wellbeing", "High mental wellbeing")),
+}
+
+def map_to_psychology_scales_batch(probabilities, mental_health_scores):
+    """Map a batch of model outputs to established psychology scales
+    
+    Args:
+        probabilities (numpy.ndarray): Class probabilities [normal, anxiety, depression, stress],
+            shape (batch, 4)
+        mental_health_scores (numpy.ndarray): Mental health scores (0-100), shape (batch,)
+    
+    Returns:
+        dict: Integer score array per scale, plus an 'interpretations' dict
+            holding a label array per scale
+    """
+    probabilities = np.asarray(probabilities)
+    mental_health_scores = np.asarray(mental_health_scores)
+    
+    mappings = {
+        'GAD-7': np.minimum(21, (probabilities[:, 1] * 21).astype(np.int64)),
+        'PHQ-9': np.minimum(27, (probabilities[:, 2] * 27).astype(np.int64)),
+        'PSS': np.minimum(40, (probabilities[:, 3] * 40).astype(np.int64)),
+        'WEMWBS': (14 + (mental_health_scores / 100) * (70 - 14)).astype(np.int64),
+    }
+    
+    mappings['interpretations'] = {
+        scale: np.asarray(labels)[np.searchsorted(edges, mappings[scale], side='right')]
+        for scale, (edges, labels) in SCALE_BANDS.items()
+    }
+    
+    return mappings
+
+
 def map_to_psychology_scales(probabilities, mental_health_score):
     """Map model outputs to established psychology scales
     
@@ -985,51 +1748,14 @@ def map_to_psychology_scales(probabilities, mental_health_score):
     Returns:
         dict: Mappings to psychology scales
     """
-    mappings = {}
-    
-    mappings['GAD-7'] = min(21, int(probabilities[1] * 21))
-    
-    mappings['PHQ-9'] = min(27, int(probabilities[2] * 27))
-    
-    mappings['PSS'] = min(40, int(probabilities[3] * 40))
-    
-    mappings['WEMWBS'] = int(14 + (mental_health_score / 100) * (70 - 14))
-    
-    mappings['interpretations'] = {}
-    
-    if mappings['GAD-7'] < 5:
-        mappings['interpretations']['GAD-7'] = "Minimal anxiety"
-    elif mappings['GAD-7'] < 10:
-        mappings['interpretations']['GAD-7'] = "Mild anxiety"
-    elif mappings['GAD-7'] < 15:
-        mappings['interpretations']['GAD-7'] = "Moderate anxiety"
-    else:
-        mappings['interpretations']['GAD-7'] = "Severe anxiety"
-    
-    if mappings['PHQ-9'] < 5:
-        mappings['interpretations']['PHQ-9'] = "Minimal depression"
-    elif mappings['PHQ-9'] < 10:
-        mappings['interpretations']['PHQ-9'] = "Mild depression"
-    elif mappings['PHQ-9'] < 15:
-        mappings['interpretations']['PHQ-9'] = "Moderate depression"
-    elif mappings['PHQ-9'] < 20:
-        mappings['interpretations']['PHQ-9'] = "Moderately severe depression"
-    else:
-        mappings['interpretations']['PHQ-9'] = "Severe depression"
-    
-    if mappings['PSS'] < 14:
-        mappings['interpretations']['PSS'] = "Low perceived stress"
-    elif mappings['PSS'] < 27:
-        mappings['interpretations']['PSS'] = "Moderate perceived stress"
-    else:
-        mappings['interpretations']['PSS'] = "High perceived stress"
+    batch = map_to_psychology_scales_batch(
+        np.asarray(probabilities)[np.newaxis], np.asarray([mental_health_score])
+    )
     
-    if mappings['WEMWBS'] < 40:
-        mappings['interpretations']['WEMWBS'] = "Low mental wellbeing"
-    elif mappings['WEMWBS'] < 59:
-        mappings['interpretations']['WEMWBS'] = "Average mental wellbeing"
-    else:
-        mappings['interpretations']['WEMWBS'] = "High mental wellbeing"
+    mappings = {scale: int(batch[scale][0]) for scale in SCALE_BANDS}
+    mappings['interpretations'] = {
+        scale: str(labels[0]) for scale, labels in batch['interpretations'].items()
+    }
     
     return mappings
 
@@ -1134,6 +1860,8 @@ def generate_pdf_report(features, probabilities, confidence, mental_health_score
     Returns:
         bytes: PDF report as bytes
     """
+    from fpdf import FPDF
+    
     class PDF(FPDF):
         def header(self):
             self.set_font('Arial', 'B', 15)
@@ -1171,8 +1899,7 @@ def generate_pdf_report(features, probabilities, confidence, mental_health_score
     pdf.set_font('Arial', '', 10)
     
     states = ['Normal', 'Anxiety', 'Depression', 'Stress']
-    for i, state in enumerate(states):
-        pdf.cell(0, 10, f'{state}: {probabilities[i]:.2f}', 0, 1)
+    pdf.multi_cell(0, 10, '\n'.join(f'{state}: {probabilities[i]:.2f}' for i, state in enumerate(states)))
     
     pdf.ln(5)
     
@@ -1180,9 +1907,10 @@ def generate_pdf_report(features, probabilities, confidence, mental_health_score
     pdf.cell(0, 10, 'Psychology Scale Mappings', 0, 1)
     pdf.set_font('Arial', '', 10)
     
-    for scale, score in scale_mappings.items():
-        if scale != 'interpretations':
-            pdf.cell(0, 10, f'{scale}: {score} - {scale_mappings["interpretations"][scale]}', 0, 1)
+    pdf.multi_cell(0, 10, '\n'.join(
+        f'{scale}: {score} - {scale_mappings["interpretations"][scale]}'
+        for scale, score in scale_mappings.items() if scale != 'interpretations'
+    ))
     
     pdf.ln(5)
     
@@ -1190,8 +1918,8 @@ def generate_pdf_report(features, probabilities, confidence, mental_health_score
     pdf.cell(0, 10, 'Clinical Interpretations', 0, 1)
     pdf.set_font('Arial', '', 10)
     
-    for interpretation in interpretations:
-        pdf.multi_cell(0, 5, f'• {interpretation}')
+    if interpretations:
+        pdf.multi_cell(0, 5, '\n'.join(f'- {interpretation}' for interpretation in interpretations))
     
     pdf.ln(5)
     
@@ -1199,8 +1927,8 @@ def generate_pdf_report(features, probabilities, confidence, mental_health_score
     pdf.cell(0, 10, 'Recommendations', 0, 1)
     pdf.set_font('Arial', '', 10)
     
-    for recommendation in recommendations:
-        pdf.multi_cell(0, 5, f'• {recommendation}')
+    if recommendations:
+        pdf.multi_cell(0, 5, '\n'.join(f'- {recommendation}' for recommendation in recommendations))
     
     pdf.ln(5)
     
@@ -1213,9 +1941,9 @@ def generate_pdf_report(features, probabilities, confidence, mental_health_score
         'zcr_mean', 'spectral_centroid_mean', 'jitter_mean', 'hnr'
     ]
     
-    for feature in key_features:
-        if feature in features:
-            pdf.cell(0, 10, f'{feature}: {features[feature]:.4f}', 0, 1)
+    feature_lines = [f'{feature}: {features[feature]:.4f}' for feature in key_features if feature in features]
+    if feature_lines:
+        pdf.multi_cell(0, 10, '\n'.join(feature_lines))
     
     pdf_bytes = pdf.output(dest='S')
     if isinstance(pdf_bytes, str):
@@ -1224,7 +1952,107 @@ def generate_pdf_report(features, probabilities, confidence, mental_health_score
     return pdf_bytes
 
 
-def run_vocalysis_analysis(audio_data=None, file_path=None, model_type='ensemble', use_secure_storage=True, storage_config=None):
+# Trained analysis models keyed by (model_type, input_dim); the synthetic
+# training data is deterministic, so retraining on every call buys nothing
+_ANALYSIS_MODEL_CACHE = {}
+
+
+def get_analysis_model(model_type, input_dim, evaluate=False):
+    """Train (or fetch from cache) the model used to score a recording
+    
+    The first call for a (model_type, input_dim) pair trains the model on
+    synthetic data and fuses it for inference; later calls reuse it. The
+    synthetic test-set metrics are only computed when asked for, once, and
+    each caller gets its own copy of them.
+    
+    Args:
+        model_type (str): Type of model ('mlp', 'cnn', 'rnn', 'attention', 'ensemble')
+        input_dim (int): Number of input features
+        evaluate (bool): Whether to also return metrics on the synthetic test set
+        
+    Returns:
+        tuple: (model, eval_results or None), or None for an unknown model type
+    """
+    cache_key = (model_type, input_dim)
+    cached = _ANALYSIS_MODEL_CACHE.get(cache_key)
+    if cached is None:
+        cached = _train_analysis_model(model_type, input_dim)
+        if cached is None:
+            return None
+        _ANALYSIS_MODEL_CACHE[cache_key] = cached
+    
+    if evaluate and cached['eval_results'] is None:
+        cached['eval_results'] = evaluate_model(cached['model'], cached['test_loader'], device=device)
+    
+    return cached['model'], copy.deepcopy(cached['eval_results']) if evaluate else None
+
+
+def _train_analysis_model(model_type, input_dim):
+    """Train and fuse an analysis model on synthetic data
+    
+    Args:
+        model_type (str): Type of model ('mlp', 'cnn', 'rnn', 'attention', 'ensemble')
+        input_dim (int): Number of input features
+        
+    Returns:
+        dict: Cache entry with the model and its synthetic test loader,
+            or None for an unknown model type
+    """
+    # Generate synthetic data for model training
+    X_synth, y_synth = generate_synthetic_data(num_samples=1000, num_features=input_dim)
+    X_train, X_test, y_train, y_test = train_test_split(X_synth, y_synth, test_size=0.2, random_state=42)
+    
+    # Keep the synthetic splits on the device: every model (four of them for
+    # the ensemble) then trains from the same resident tensors
+    train_dataset = MentalHealthDataset(X_train, y_train).to(device)
+    test_dataset = MentalHealthDataset(X_test, y_test).to(device)
+    
+    train_loader = create_data_loader(train_dataset, batch_size=32, shuffle=True)
+    test_loader = create_data_loader(test_dataset, batch_size=32, shuffle=False)
+    
+    if model_type == 'mlp':
+        model = MentalHealthModel(input_dim=input_dim, hidden_dims=[128, 64], num_classes=4)
+    elif model_type == 'cnn':
+        model = CNNMentalHealthModel(input_dim=input_dim, num_classes=4)
+    elif model_type == 'rnn':
+        model = RNNMentalHealthModel(input_dim=input_dim, hidden_dim=128, num_layers=2, num_classes=4)
+    elif model_type == 'attention':
+        model = AttentionMentalHealthModel(input_dim=input_dim, hidden_dim=128, num_classes=4)
+    elif model_type == 'ensemble':
+        # Create an ensemble of all model types
+        models = [
+            MentalHealthModel(input_dim=input_dim, hidden_dims=[128, 64], num_classes=4),
+            CNNMentalHealthModel(input_dim=input_dim, num_classes=4),
+            RNNMentalHealthModel(input_dim=input_dim, hidden_dim=128, num_layers=2, num_classes=4),
+            AttentionMentalHealthModel(input_dim=input_dim, hidden_dim=128, num_classes=4)
+        ]
+        
+        trained_models = []
+        for i, m in enumerate(models):
+            print(f"Training model {i+1}/{len(models)}...")
+            trained_model, _ = train_model(m, train_loader, test_loader, num_epochs=20, device=device)
+            trained_models.append(trained_model)
+            if device.type == 'cuda':
+                # Hand the previous model's activation/optimizer blocks back before the next one
+                torch.cuda.empty_cache()
+        
+        model = EnsembleMentalHealthModel(trained_models)
+    else:
+        return None
+    
+    if model_type != 'ensemble':
+        model, history = train_model(model, train_loader, test_loader, num_epochs=20, device=device)
+    
+    model.eval()
+    for module in list(model.modules()):
+        if isinstance(module, (MentalHealthModel, CNNMentalHealthModel)):
+            module.fuse_for_inference()
+    
+    return {'model': model, 'test_loader': test_loader, 'eval_results': None}
+
+
+def run_vocalysis_analysis(audio_data=None, file_path=None, model_type='ensemble', use_secure_storage=True, storage_config=None,
+                           inference_batch_size=256, return_eval_metrics=False):
     """Run the complete Vocalysis analysis pipeline
     
     Args:
@@ -1233,6 +2061,9 @@ def run_vocalysis_analysis(audio_data=None, file_path=None, model_type='ensemble
         model_type (str): Type of model to use ('mlp', 'cnn', 'rnn', 'attention', 'ensemble')
         use_secure_storage (bool): Whether to use secure storage
         storage_config (dict, optional): Configuration for secure storage
+        inference_batch_size (int): Segments per forward pass when scoring the recording
+        return_eval_metrics (bool): Whether to include the model's synthetic test-set
+            metrics under 'evaluation' (None otherwise)
         
     Returns:
         dict: Analysis results
@@ -1252,7 +2083,8 @@ def run_vocalysis_analysis(audio_data=None, file_path=None, model_type='ensemble
     
     # Extract features
     features_df = feature_extractor.extract_features_batch(segments)
-    avg_features = features_df.mean().to_dict()
+    feature_block = np.ascontiguousarray(features_df.to_numpy(dtype=np.float32))
+    avg_features = dict(zip(features_df.columns, feature_block.mean(axis=0, dtype=np.float64).tolist()))
     
     voice_data_id = None
     if use_secure_storage:
@@ -1283,60 +2115,31 @@ def run_vocalysis_analysis(audio_data=None, file_path=None, model_type='ensemble
         except Exception as e:
             print(f"Warning: Failed to store voice data securely: {e}")
     
-    # Generate synthetic data for model training
-    X_synth, y_synth = generate_synthetic_data(num_samples=1000, num_features=len(avg_features))
-    X_train, X_test, y_train, y_test = train_test_split(X_synth, y_synth, test_size=0.2, random_state=42)
-    
-    train_dataset = MentalHealthDataset(X_train, y_train)
-    test_dataset = MentalHealthDataset(X_test, y_test)
-    
-    train_loader = DataLoader(train_dataset, batch_size=32, shuffle=True)
-    test_loader = DataLoader(test_dataset, batch_size=32, shuffle=False)
-    
-    input_dim = len(avg_features)
-    
-    if model_type == 'mlp':
-        model = MentalHealthModel(input_dim=input_dim, hidden_dims=[128, 64], num_classes=4)
-    elif model_type == 'cnn':
-        model = CNNMentalHealthModel(input_dim=input_dim, num_classes=4)
-    elif model_type == 'rnn':
-        model = RNNMentalHealthModel(input_dim=input_dim, hidden_dim=128, num_layers=2, num_classes=4)
-    elif model_type == 'attention':
-        model = AttentionMentalHealthModel(input_dim=input_dim, hidden_dim=128, num_classes=4)
-    elif model_type == 'ensemble':
-        # Create an ensemble of all model types
-        models = [
-            MentalHealthModel(input_dim=input_dim, hidden_dims=[128, 64], num_classes=4),
-            CNNMentalHealthModel(input_dim=input_dim, num_classes=4),
-            RNNMentalHealthModel(input_dim=input_dim, hidden_dim=128, num_layers=2, num_classes=4),
-            AttentionMentalHealthModel(input_dim=input_dim, hidden_dim=128, num_classes=4)
-        ]
-        
-        trained_models = []
-        for i, m in enumerate(models):
-            print(f"Training model {i+1}/{len(models)}...")
-            trained_model, _ = train_model(m, train_loader, test_loader, num_epochs=20, device=device)
-            trained_models.append(trained_model)
-        
-        model = EnsembleMentalHealthModel(trained_models)
-    else:
+    analysis_model = get_analysis_model(model_type, len(avg_features), evaluate=return_eval_metrics)
+    if analysis_model is None:
         return {'error': f"Unknown model type: {model_type}"}
-    
-    if model_type != 'ensemble':
-        model, history = train_model(model, train_loader, test_loader, num_epochs=20, device=device)
-    
-    # Evaluate the model
-    eval_results = evaluate_model(model, test_loader, device=device)
+    model, eval_results = analysis_model
     
     # Make predictions on the actual voice features
-    features_tensor = torch.FloatTensor(features_df.values).to(device)
-    
-    model.eval()
-    with torch.no_grad():
-        probabilities, confidence = model(features_tensor)
-        
-        avg_probs = probabilities.mean(dim=0).cpu().numpy()
-        avg_conf = confidence.mean().item()
+    features_tensor = torch.from_numpy(feature_block)
+    if device.type == 'cuda':
+        features_tensor = features_tensor.pin_memory()
+    features_tensor = features_tensor.to(device, non_blocking=True)
+    
+    # Run segments through in bounded chunks and keep running sums so long
+    # recordings never materialize the full probability matrix
+    with torch.inference_mode():
+        use_amp, amp_dtype = amp_settings(device)
+        probs_sum = torch.zeros(4, device=device)
+        conf_sum = torch.zeros((), device=device)
+        for chunk in features_tensor.split(inference_batch_size):
+            with torch.autocast(device_type=device.type, dtype=amp_dtype, enabled=use_amp):
+                probabilities, confidence = predict_proba(model, chunk)
+            probs_sum += probabilities.float().sum(dim=0)
+            conf_sum += confidence.float().sum()
+        
+        avg_probs = (probs_sum / len(features_tensor)).cpu().numpy()
+        avg_conf = (conf_sum / len(features_tensor)).item()
     
     # Calculate mental health score
     mental_health_score = calculate_mental_health_score(avg_probs, avg_conf)
@@ -1391,6 +2194,8 @@ def display_results(results):
         print(f"Error: {results['error']}")
         return
     
+    import matplotlib.pyplot as plt
+    
     # Display mental health score
     print("\n=== Mental Health Assessment Results ===\n")
     
@@ -1464,13 +2269,17 @@ def display_results(results):
     print("PDF report generated successfully. Use the 'pdf_report' key in the results dictionary to access it.")
 
 
-def save_model(model, feature_names, class_names=['Normal', 'Anxiety', 'Depression', 'Stress']):
+def save_model(model, feature_names, class_names=['Normal', 'Anxiety', 'Depression', 'Stress'], quantized=False,
+               mixed_precision=False):
     """Save the trained model and metadata
     
     Args:
         model (nn.Module): Trained model
         feature_names (list): List of feature names
         class_names (list): List of class names
+        quantized (bool): Record that load_model should quantize the model to INT8
+        mixed_precision (bool): Record that load_model should run the model under
+            BF16/FP16 autocast on CUDA
     
     Returns:
         str: Path to saved model
@@ -1486,6 +2295,8 @@ def save_model(model, feature_names, class_names=['Normal', 'Anxiety', 'Depressi
         'num_classes': len(class_names),
         'feature_names': feature_names,
         'class_names': class_names,
+        'quantized': quantized,
+        'fp16': mixed_precision,
         'version': '1.0',
         'date_created': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     }
@@ -1499,6 +2310,71 @@ def save_model(model, feature_names, class_names=['Normal', 'Anxiety', 'Depressi
     return 'model/vocalysis_model.pth'
 
 
+def save_quantized_model(model, model_path='model/vocalysis_model_int8.pt'):
+    """Save an INT8, TorchScript-compiled copy of a trained model for CPU scoring
+    
+    Linear layers are dynamically quantized to INT8 (weights stored as
+    INT8, activations quantized per batch), and the result is scripted so
+    it can be loaded with torch.jit.load without the Python class. Like the
+    source model it returns (class_logits, confidence).
+    
+    Args:
+        model (nn.Module): Trained model
+        model_path (str): Path to write the scripted model to
+    
+    Returns:
+        str: Path to saved model
+    """
+    os.makedirs(os.path.dirname(model_path), exist_ok=True)
+    
+    cpu_model = copy.deepcopy(model).cpu().eval()
+    if isinstance(cpu_model, MentalHealthModel):
+        cpu_model.fuse_for_inference()
+    
+    quantized = torch.quantization.quantize_dynamic(cpu_model, {nn.Linear}, dtype=torch.qint8)
+    torch.jit.script(quantized).save(model_path)
+    
+    print(f"Quantized model saved to '{model_path}'")
+    
+    return model_path
+
+
+def export_onnx(model, input_dim, model_path='model/vocalysis_model.onnx'):
+    """Export a trained model to ONNX for GPU serving runtimes
+    
+    BatchNorm is folded into the preceding layers first and the batch axis
+    is left dynamic. The file can be served with ONNX Runtime or compiled
+    into a TensorRT FP16 engine, e.g.
+    ``trtexec --onnx=model/vocalysis_model.onnx --fp16 --saveEngine=model/vocalysis_model.engine``.
+    Requires the onnx package.
+    
+    Args:
+        model (nn.Module): Trained model
+        input_dim (int): Number of input features
+        model_path (str): Path to write the ONNX graph to
+    
+    Returns:
+        str: Path to saved model
+    """
+    os.makedirs(os.path.dirname(model_path), exist_ok=True)
+    
+    cpu_model = copy.deepcopy(model).cpu().eval()
+    for module in list(cpu_model.modules()):
+        if isinstance(module, (MentalHealthModel, CNNMentalHealthModel)):
+            module.fuse_for_inference()
+    
+    torch.onnx.export(
+        cpu_model, (torch.randn(2, input_dim),), model_path,
+        input_names=['features'], output_names=['logits', 'confidence'],
+        dynamic_axes={'features': {0: 'batch'}, 'logits': {0: 'batch'}, 'confidence': {0: 'batch'}},
+        opset_version=17
+    )
+    
+    print(f"ONNX model saved to '{model_path}'")
+    
+    return model_path
+
+
 class CNNMentalHealthModel(nn.Module):
     """CNN model for mental health classification"""
     
@@ -1551,7 +2427,7 @@ class CNNMentalHealthModel(nn.Module):
             x (torch.Tensor): Input tensor (batch_size, input_dim)
             
         Returns:
-            tuple: (class_probabilities, confidence)
+            tuple: (class_logits, confidence)
         """
         x = x.unsqueeze(1)
         
@@ -1562,7 +2438,37 @@ class CNNMentalHealthModel(nn.Module):
         logits = self.classifier(features)
         confidence = self.confidence(features)
         
-        return torch.softmax(logits, dim=1), confidence
+        return logits, confidence
+    
+    @torch.no_grad()
+    def fuse_for_inference(self):
+        """Fold each BatchNorm into the preceding Conv1d layer for inference
+        
+        Same idea as MentalHealthModel.fuse_for_inference, applied to the
+        convolutional stack. The model is switched to eval mode and should
+        not be trained afterwards.
+        
+        Returns:
+            CNNMentalHealthModel: self, with fused convolutions
+        """
+        self.eval()
+        
+        layers = []
+        modules = list(self.conv_layers)
+        i = 0
+        while i < len(modules):
+            module = modules[i]
+            next_module = modules[i + 1] if i + 1 < len(modules) else None
+            if isinstance(module, nn.Conv1d) and isinstance(next_module, nn.BatchNorm1d):
+                layers.append(fuse_conv_bn_eval(module, next_module))
+                i += 2
+            else:
+                layers.append(module)
+                i += 1
+        
+        self.conv_layers = nn.Sequential(*layers).eval()
+        self.classifier = nn.Sequential(*[m for m in self.classifier if not isinstance(m, nn.Dropout)]).eval()
+        return self
 
 
 class RNNMentalHealthModel(nn.Module):
@@ -1614,10 +2520,10 @@ class RNNMentalHealthModel(nn.Module):
             x (torch.Tensor): Input tensor (batch_size, input_dim)
             
         Returns:
-            tuple: (class_probabilities, confidence)
+            tuple: (class_logits, confidence)
         """
+        # Features are the sequence: one scalar step per feature, matching input_size=1
         x = x.unsqueeze(2)  # (batch_size, input_dim, 1)
-        x = x.transpose(1, 2)  # (batch_size, 1, input_dim)
         
         gru_out, _ = self.gru(x)
         
@@ -1626,7 +2532,7 @@ class RNNMentalHealthModel(nn.Module):
         logits = self.classifier(features)
         confidence = self.confidence(features)
         
-        return torch.softmax(logits, dim=1), confidence
+        return logits, confidence
 
 
 class AttentionMentalHealthModel(nn.Module):
@@ -1645,15 +2551,15 @@ class AttentionMentalHealthModel(nn.Module):
         
         self.input_dim = input_dim
         self.hidden_dim = hidden_dim
+        self.use_sdpa = _HAS_SDPA
         
         self.embedding = nn.Sequential(
             nn.Linear(1, hidden_dim),
             nn.ReLU()
         )
         
-        self.attention_query = nn.Linear(hidden_dim, hidden_dim)
-        self.attention_key = nn.Linear(hidden_dim, hidden_dim)
-        self.attention_value = nn.Linear(hidden_dim, hidden_dim)
+        # Query, key and value projections stacked into one GEMM
+        self.attention_qkv = nn.Linear(hidden_dim, 3 * hidden_dim)
         
         self.classifier = nn.Sequential(
             nn.Linear(hidden_dim, 64),
@@ -1680,14 +2586,19 @@ class AttentionMentalHealthModel(nn.Module):
         Returns:
             torch.Tensor: Attended features
         """
-        # Calculate attention scores
-        scores = torch.matmul(query, key.transpose(-2, -1)) / (self.hidden_dim ** 0.5)
-        
-        attention_weights = torch.softmax(scores, dim=-1)
-        
-        attended_values = torch.matmul(attention_weights, value)
-        
-        return attended_values
+        if self.use_sdpa and query.is_cuda:
+            # softmax(QK^T / sqrt(hidden_dim)) V in one fused flash/memory-efficient
+            # kernel; the default scale is 1/sqrt of the last query dim, i.e. hidden_dim
+            return nn.functional.scaled_dot_product_attention(query, key, value)
+        
+        # CPU (where this measured faster than SDPA's math path) and older torch:
+        # fold the scale into the score GEMM (beta=0 ignores the uninitialized
+        # input) rather than running a separate division
+        scores = torch.baddbmm(
+            torch.empty(query.shape[0], query.shape[1], key.shape[1], dtype=query.dtype, device=query.device),
+            query, key.transpose(-2, -1), beta=0.0, alpha=self.hidden_dim ** -0.5
+        )
+        return torch.bmm(torch.softmax(scores, dim=-1), value)
     
     def forward(self, x):
         """Forward pass
@@ -1696,15 +2607,13 @@ class AttentionMentalHealthModel(nn.Module):
             x (torch.Tensor): Input tensor (batch_size, input_dim)
             
         Returns:
-            tuple: (class_probabilities, confidence)
+            tuple: (class_logits, confidence)
         """
         x = x.unsqueeze(2)
         
         embedded = self.embedding(x)  # (batch_size, input_dim, hidden_dim)
         
-        query = self.attention_query(embedded)
-        key = self.attention_key(embedded)
-        value = self.attention_value(embedded)
+        query, key, value = self.attention_qkv(embedded).chunk(3, dim=-1)
         attended = self.attention(query, key, value)
         
         features = attended.mean(dim=1)  # (batch_size, hidden_dim)
@@ -1712,7 +2621,38 @@ class AttentionMentalHealthModel(nn.Module):
         logits = self.classifier(features)
         confidence = self.confidence(features)
         
-        return torch.softmax(logits, dim=1), confidence
+        return logits, confidence
+    
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        """Accept checkpoints saved with separate query/key/value projections"""
+        old_prefixes = [f'{prefix}attention_{name}.' for name in ('query', 'key', 'value')]
+        if f'{old_prefixes[0]}weight' in state_dict:
+            for param in ('weight', 'bias'):
+                state_dict[f'{prefix}attention_qkv.{param}'] = torch.cat(
+                    [state_dict.pop(old_prefix + param) for old_prefix in old_prefixes]
+                )
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+
+
+# Side CUDA streams for ensemble members, per device; kept outside the
+# module so ensembles stay deep-copyable and picklable
+_SIDE_STREAMS = {}
+
+
+def _side_streams(cuda_device, count):
+    """Return `count` reusable CUDA streams on a device
+    
+    Args:
+        cuda_device (torch.device): CUDA device
+        count (int): Number of streams needed
+    
+    Returns:
+        list: torch.cuda.Stream objects
+    """
+    streams = _SIDE_STREAMS.setdefault(cuda_device, [])
+    while len(streams) < count:
+        streams.append(torch.cuda.Stream(device=cuda_device))
+    return streams[:count]
 
 
 class EnsembleMentalHealthModel(nn.Module):
@@ -1730,9 +2670,14 @@ class EnsembleMentalHealthModel(nn.Module):
         self.models = nn.ModuleList(models)
         
         if weights is None:
-            self.weights = torch.ones(len(models)) / len(models)
+            weights = torch.ones(len(models)) / len(models)
         else:
-            self.weights = torch.tensor(weights) / sum(weights)
+            weights = torch.tensor(weights, dtype=torch.float32) / sum(weights)
+        # Non-persistent buffers: follow .to(device) with the members but
+        # stay out of the state_dict. Log-weights are pre-shaped for the
+        # (num_models, batch_size, num_classes) log-probabilities.
+        self.register_buffer('weights', weights, persistent=False)
+        self.register_buffer('log_weights', torch.log(weights).view(-1, 1, 1), persistent=False)
     
     def forward(self, x):
         """Forward pass
@@ -1741,34 +2686,100 @@ class EnsembleMentalHealthModel(nn.Module):
             x (torch.Tensor): Input tensor
             
         Returns:
-            tuple: (ensemble_probabilities, ensemble_confidence)
+            tuple: (ensemble_logits, ensemble_confidence); softmax of the
+                logits is the weighted mean of the members' probabilities
         """
-        all_probs = []
-        all_confidences = []
+        if not torch.jit.is_scripting() and x.is_cuda and len(self.models) > 1:
+            all_logits, all_confidences = self._forward_members_on_streams(x)
+        else:
+            all_logits = []
+            all_confidences = []
+            for model in self.models:
+                logits, confidence = model(x)
+                all_logits.append(logits)
+                all_confidences.append(confidence)
+        
+        all_log_probs = torch.log_softmax(torch.stack(all_logits, dim=0), dim=-1)  # (num_models, batch_size, num_classes)
+        all_confidences = torch.stack(all_confidences, dim=0)  # (num_models, batch_size, 1)
         
-        for model in self.models:
-            probs, confidence = model(x)
-            all_probs.append(probs)
-            all_confidences.append(confidence)
+        # log(sum_m w_m * p_m), computed stably in log space
+        ensemble_logits = torch.logsumexp(all_log_probs + self.log_weights.to(all_log_probs.dtype), dim=0)  # (batch_size, num_classes)
+        # Weighted sum as one contraction, without a (num_models, batch_size, 1) product
+        ensemble_confidence = torch.einsum('m,mbk->bk', self.weights.to(all_confidences.dtype), all_confidences)  # (batch_size, 1)
         
-        all_probs = torch.stack(all_probs, dim=0)  # (num_models, batch_size, num_classes)
-        all_confidences = torch.stack(all_confidences, dim=0)  # (num_models, batch_size, 1)
+        return ensemble_logits, ensemble_confidence
+    
+    @torch.jit.unused
+    def _forward_members_on_streams(self, x):
+        """Run every member on its own CUDA stream
+        
+        Small members underfill the GPU, so their kernels are overlapped on
+        side streams and joined back onto the current stream.
+        
+        Args:
+            x (torch.Tensor): CUDA input tensor
+            
+        Returns:
+            tuple: (list of member logits, list of member confidences)
+        """
+        all_logits = []
+        all_confidences = []
         
-        weighted_probs = all_probs * self.weights.view(-1, 1, 1)
-        weighted_confidences = all_confidences * self.weights.view(-1, 1, 1)
+        current_stream = torch.cuda.current_stream(x.device)
+        streams = _side_streams(x.device, len(self.models))
+        for model, stream in zip(self.models, streams):
+            stream.wait_stream(current_stream)
+            x.record_stream(stream)
+            with torch.cuda.stream(stream):
+                logits, confidence = model(x)
+            all_logits.append(logits)
+            all_confidences.append(confidence)
         
-        ensemble_probs = weighted_probs.sum(dim=0)  # (batch_size, num_classes)
-        ensemble_confidence = weighted_confidences.sum(dim=0)  # (batch_size, 1)
+        for stream in streams:
+            current_stream.wait_stream(stream)
+        # Outputs were allocated on the side streams but are consumed on this one
+        for tensor in all_logits + all_confidences:
+            tensor.record_stream(current_stream)
         
-        return ensemble_probs, ensemble_confidence
+        return all_logits, all_confidences
 
 
-def load_model(model_path, model_info_path):
+def load_model(model_path, model_info_path, use_compile=False, quantize=None, mixed_precision=None):
     """Load a trained model
     
+    On CPU, an unquantized model is additionally passed through Intel Extension
+    for PyTorch (oneDNN kernels, Conv+BN folding) when that package is installed.
+    Loaded models are cached on the files' paths and modification times, so
+    repeated calls return the same (shared, eval-mode) model until either file
+    changes. The model is returned wrapped in InferenceModel, so every call
+    runs under torch.inference_mode. Because it is shared, callers must not
+    train it, move it or otherwise change it in place; copy.deepcopy it
+    first. Each call gets its own copy of model_info.
+    
     Args:
         model_path (str): Path to model file
         model_info_path (str): Path to model info file
+        use_compile (bool): Return the model wrapped by compile_model for inference
+        quantize (bool, optional): Dynamically quantize Linear/GRU layers to INT8 for
+            CPU inference; defaults to the 'quantized' flag in the model info
+        mixed_precision (bool, optional): On CUDA, move the model to the GPU and run it
+            under BF16/FP16 autocast; defaults to the 'fp16' flag in the model info
+    
+    Returns:
+        tuple: (model, model_info)
+    """
+    model, model_info = _load_model_cached(
+        os.path.abspath(model_path), os.stat(model_path).st_mtime_ns,
+        os.path.abspath(model_info_path), os.stat(model_info_path).st_mtime_ns,
+        use_compile, quantize, mixed_precision
+    )
+    return model, copy.deepcopy(model_info)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_model_cached(model_path, model_mtime, model_info_path, model_info_mtime,
+                       use_compile, quantize, mixed_precision):
+    """Build and load a model for load_model; the mtimes only key the cache
     
     Returns:
         tuple: (model, model_info)
@@ -1805,7 +2816,32 @@ def load_model(model_path, model_info_path):
     else:
         raise ValueError(f"Unknown model type: {model_type}")
     
-    model.load_state_dict(torch.load(model_path))
+    # Memory-map the checkpoint instead of reading it into a host buffer and
+    # copying the storages out; weights_only skips arbitrary unpickling
+    state_dict = torch.load(model_path, map_location='cpu', **_TORCH_LOAD_KWARGS)
+    model.load_state_dict(state_dict)
     model.eval()
     
-    return model, model_info
+    if quantize is None:
+        quantize = model_info.get('quantized', False)
+    if mixed_precision is None:
+        mixed_precision = model_info.get('fp16', False)
+    
+    if quantize:
+        # Dynamic quantization has no calibration step, so it is simply
+        # reapplied on every load; INT8 kernels are CPU-only
+        model = torch.ao.quantization.quantize_dynamic(model.cpu(), {nn.Linear, nn.GRU}, dtype=torch.qint8)
+    elif device.type == 'cpu':
+        try:
+            import intel_extension_for_pytorch as ipex
+        except ImportError:
+            pass
+        else:
+            model = ipex.optimize(model, dtype=torch.float32, inplace=True)
+    elif mixed_precision and device.type == 'cuda':
+        model = AutocastModel(model.to(device))
+    
+    if use_compile:
+        model = compile_model(model)
+    
+    return InferenceModel(model), model_info